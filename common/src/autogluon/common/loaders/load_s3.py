@@ -88,12 +88,14 @@ def list_bucket_prefix_suffix_contains_s3(
     if exclude_contains is not None and not isinstance(exclude_contains, list):
         exclude_contains = [exclude_contains]
 
-    s3 = boto3.resource("s3")
-    my_bucket = s3.Bucket(bucket)
+    # The low-level paginator avoids constructing an ObjectSummary resource for every listed key
+    paginator = boto3.client("s3").get_paginator("list_objects_v2")
+    pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
+    keys = (obj["Key"] for page in pages for obj in page.get("Contents", ()))
 
     files = []
-    for object_summary in my_bucket.objects.filter(Prefix=prefix):
-        suffix_full = object_summary.key.split(prefix, 1)[1] if len(prefix) > 0 else object_summary.key
+    for key in keys:
+        suffix_full = key.split(prefix, 1)[1] if len(prefix) > 0 else key
         is_banned = False
         for banned_s in exclude_suffix:
             if suffix_full.endswith(banned_s):
@@ -116,10 +118,10 @@ def list_bucket_prefix_suffix_contains_s3(
             if not has_valid_suffix:
                 continue
         if contains is None:
-            files.append(object_summary.key)
+            files.append(key)
         else:
             for c in contains:
                 if c in suffix_full:
-                    files.append(object_summary.key)
+                    files.append(key)
                     break
     return files
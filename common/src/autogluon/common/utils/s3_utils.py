@@ -2,6 +2,7 @@ import logging
 import os
 import pathlib
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple, Union
 
 from tqdm import tqdm
@@ -402,16 +403,49 @@ def copy_s3_file(origin_path: str, destination_path: str) -> None:
     )
 
 
-def download_s3_files(*, s3_to_local_tuple_list: List[Tuple[str, str]], dry_run: bool = False, verbose: bool = False):
+def download_s3_files(
+    *,
+    s3_to_local_tuple_list: List[Tuple[str, str]],
+    dry_run: bool = False,
+    verbose: bool = False,
+    max_workers: int = 16,
+):
     """
-    For (s3_path, local_path) in `s3_to_local_tuple_list`, call `download_s3_file`.
+    For (s3_path, local_path) in `s3_to_local_tuple_list`, download the s3 file to the local path.
+
+    Files are downloaded concurrently with `max_workers` threads sharing a single boto3 client,
+    which overlaps the per-request latency when downloading many small files.
+    If `max_workers=1` or `dry_run=True`, files are processed sequentially via `download_s3_file`.
     """
     for s3_path, _ in s3_to_local_tuple_list:
         assert is_s3_url(path=s3_path), f'S3 path is not a valid S3 URL: "{s3_path}"'
     num_files = len(s3_to_local_tuple_list)
-    for i in tqdm(range(num_files), disable=(not verbose) or dry_run, desc="Downloading S3 Files"):
-        s3_path, local_path = s3_to_local_tuple_list[i]
-        download_s3_file(s3_path=s3_path, local_path=local_path, mkdir=True, dry_run=dry_run)
+    if dry_run or max_workers <= 1 or num_files <= 1:
+        for i in tqdm(range(num_files), disable=(not verbose) or dry_run, desc="Downloading S3 Files"):
+            s3_path, local_path = s3_to_local_tuple_list[i]
+            download_s3_file(s3_path=s3_path, local_path=local_path, mkdir=True, dry_run=dry_run)
+        return
+
+    import boto3
+
+    # create each local directory once up front instead of once per file
+    directories = {os.path.dirname(local_path) for _, local_path in s3_to_local_tuple_list}
+    for directory in directories - {"", "."}:
+        pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
+
+    # the client is created once from the default session, so that it respects `boto3.setup_default_session`,
+    # and shared by all threads; boto3 clients are thread-safe, unlike resources
+    s3_client = boto3.client("s3")
+
+    def _download(s3_path: str, local_path: str):
+        s3_bucket, s3_prefix = s3_path_to_bucket_prefix(s3_path=s3_path)
+        s3_client.download_file(s3_bucket, s3_prefix, local_path)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, num_files)) as executor:
+        futures = [executor.submit(_download, s3_path, local_path) for s3_path, local_path in s3_to_local_tuple_list]
+        for future in tqdm(as_completed(futures), total=num_files, disable=not verbose, desc="Downloading S3 Files"):
+            # re-raise the first error encountered during download
+            future.result()
 
 
 def _get_local_objs_to_upload_and_s3_prefix(folder_to_upload: str) -> List[Tuple[str, str]]:
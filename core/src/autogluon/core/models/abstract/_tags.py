@@ -1,4 +1,8 @@
-_DEFAULT_TAGS = {
+from types import MappingProxyType
+
+# The default tags are read-only views: they are shared by every model, so they must never be mutated in place.
+# Models override them by returning their own dict from `_more_tags` / `_class_tags`.
+_DEFAULT_TAGS = MappingProxyType({
     # [Advanced] Whether the model can support fitting on 100% of the data and then getting unbiased predictions on the same data.
     # it fit on by exploiting special properties of the model architecture.
     # For example, random forest uses only a portion of the training data randomly for each decision tree.
@@ -26,10 +30,10 @@ _DEFAULT_TAGS = {
     #  This can get very complex to implement correctly for refit_full.
     #  It is recommended in these scenarios to set `can_refit_full` to False until a correct implementation is added.
     "can_refit_full": False,
-}
+})
 
 
-_DEFAULT_CLASS_TAGS = {
+_DEFAULT_CLASS_TAGS = MappingProxyType({
     # Whether the model can handle raw text input features.
     #  Used for informing the global feature preprocessor on if it should keep raw text features.
     "handles_text": False,
@@ -39,4 +43,4 @@ _DEFAULT_CLASS_TAGS = {
     # For large datasets, it is much faster to get a memory estimate using this technique rather than having to first initialize the model
     # For example, going from 15s -> 0.1s, approximately a 100x speedup.
     "can_estimate_memory_usage_static": False,
-}
+})
@@ -1,7 +1,11 @@
+import contextlib
+import functools
 import logging
-from typing import Optional
+import os
+from typing import Dict, Optional, Tuple, Union
 
 import torch
+import torch.nn.functional as F
 from torch import nn
 
 from ..constants import (
@@ -32,6 +36,21 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+@torch.jit.script
+def _postprocess_image_features(features: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    L2-normalize the image features and average them over images.
+    It is scripted so that the pointwise ops can be fused into fewer kernels.
+    """
+    features = F.normalize(features, dim=-1, eps=1e-6)
+    return features, features.mean(dim=1)
+
+
+@torch.jit.script
+def _normalize_text_features(features: torch.Tensor) -> torch.Tensor:
+    return F.normalize(features, dim=-1, eps=1e-12)
+
+
 class CLIPForImageText(nn.Module):
     """
     Support the CLIP model.
@@ -54,6 +73,9 @@ class CLIPForImageText(nn.Module):
         max_text_len: Optional[int] = None,
         text_segment_num: Optional[int] = 1,
         is_matching: Optional[bool] = False,
+        compile_mode: Optional[str] = None,
+        compile_cache_dir: Optional[str] = None,
+        precision: Optional[Union[int, str]] = None,
     ):
         """
         Load the pretrained CLIP from huggingface transformers.
@@ -70,6 +92,22 @@ class CLIPForImageText(nn.Module):
             Whether using the pretrained weights. If pretrained=True, download the pretrained model.
         tokenizer_name
             Name of the huggingface tokenizer type.
+        is_matching
+            Whether the model is used for semantic matching.
+        compile_mode
+            If provided, compile the vision and text encoders in place with torch.compile using this mode,
+            e.g., "reduce-overhead". The first one or two forward passes per input shape are slow due to
+            compilation. Use env.compile instead to compile the whole fused model.
+        compile_cache_dir
+            If provided together with compile_mode, persist the compiled kernels and graphs in this directory,
+            so that later processes reuse them instead of paying the compilation warmup again. Inductor's cache
+            settings are only changed during the first forward of each encoder, when it is compiled, so other
+            compiled models in the process are unaffected.
+        precision
+            If provided, e.g., "bf16" or "16", run the vision and text encoders under autocast with this precision
+            even when the caller, e.g., a feature extraction call, doesn't set up mixed precision itself.
+            The encoder outputs are cast back to the parameter dtype, so the normalization and the head
+            run in the model's own precision. None leaves the precision to the caller.
         """
         super().__init__()
         logger.debug(f"initializing {prefix} (CLIPForImageText)")
@@ -80,8 +118,17 @@ class CLIPForImageText(nn.Module):
             has_image, has_text = True, True
         self.has_image = has_image
         self.has_text = has_text
+        self.is_matching = is_matching
+        self.precision = precision
 
-        self.config, self.model = get_hf_config_and_model(checkpoint_name=checkpoint_name, pretrained=pretrained)
+        try:
+            # request the fused SDPA attention kernels, which checkpoint configs may pin to the eager path
+            self.config, self.model = get_hf_config_and_model(
+                checkpoint_name=checkpoint_name, pretrained=pretrained, attn_implementation="sdpa"
+            )
+        except ValueError as e:
+            logger.debug(f"SDPA attention is unavailable for {checkpoint_name}, using the default attention: {e}")
+            self.config, self.model = get_hf_config_and_model(checkpoint_name=checkpoint_name, pretrained=pretrained)
 
         if not self.has_image:
             self.model.vision_model = None
@@ -91,6 +138,19 @@ class CLIPForImageText(nn.Module):
             self.model.text_model = None
             self.model.text_projection = None
 
+        self.compile_cache_dir = None
+        # names of the compiled encoders whose first forward, and thus compilation, has not happened yet
+        self._pending_compile_cache_encoders = set()
+        if compile_mode is not None:
+            if compile_cache_dir is not None:
+                os.makedirs(compile_cache_dir, exist_ok=True)
+                self.compile_cache_dir = compile_cache_dir
+                self._pending_compile_cache_encoders = {"vision_model", "text_model"}
+            # compile in place so that parameter names and checkpoints are unchanged
+            for encoder in (self.model.vision_model, self.model.text_model):
+                if encoder is not None:
+                    encoder.compile(mode=compile_mode, dynamic=True)
+
         self.out_features = self.model.config.projection_dim
 
         self.head = nn.Linear(self.out_features, num_classes) if num_classes else nn.Identity()
@@ -127,34 +187,56 @@ class CLIPForImageText(nn.Module):
                 checkpoint_name=self.checkpoint_name,
             )
 
+        self._step_cache: Dict[Tuple[int, torch.device, torch.dtype], torch.Tensor] = {}
+        self._encoder_streams: Dict[torch.device, Tuple[torch.cuda.Stream, torch.cuda.Stream]] = {}
         self.name_to_id = self.get_layer_ids()
         self.head_layer_names = [n for n, layer_id in self.name_to_id.items() if layer_id == 0]
 
-    @property
+        self.forward = self._select_forward()
+
+    _PREFIX_DERIVED_KEYS = (
+        "text_token_ids_key",
+        "text_valid_length_key",
+        "image_key",
+        "image_valid_num_key",
+        "label_key",
+        "text_column_prefix",
+        "image_column_prefix",
+    )
+
+    def __setattr__(self, name, value):
+        # The batch keys are cached per instance; drop them when the model is renamed
+        # (e.g., by modify_duplicate_model_names) so they follow the new prefix.
+        if name == "prefix":
+            for key in self._PREFIX_DERIVED_KEYS:
+                self.__dict__.pop(key, None)
+        super().__setattr__(name, value)
+
+    @functools.cached_property
     def text_token_ids_key(self):
         return f"{self.prefix}_{TEXT_TOKEN_IDS}"
 
-    @property
+    @functools.cached_property
     def text_valid_length_key(self):
         return f"{self.prefix}_{TEXT_VALID_LENGTH}"
 
-    @property
+    @functools.cached_property
     def image_key(self):
         return f"{self.prefix}_{IMAGE}"
 
-    @property
+    @functools.cached_property
     def image_valid_num_key(self):
         return f"{self.prefix}_{IMAGE_VALID_NUM}"
 
-    @property
+    @functools.cached_property
     def label_key(self):
         return f"{self.prefix}_{LABEL}"
 
-    @property
+    @functools.cached_property
     def text_column_prefix(self):
         return f"{self.text_token_ids_key}_{COLUMN}"
 
-    @property
+    @functools.cached_property
     def image_column_prefix(self):
         return f"{self.image_key}_{COLUMN}"
 
@@ -190,78 +272,251 @@ class CLIPForImageText(nn.Module):
         -------
             A dictionary with logits and features.
         """
-        has_image = self.has_image and self.image_key in batch
-        has_text = self.has_text and self.text_token_ids_key in batch
-        ret = {COLUMN_FEATURES: {FEATURES: {}, MASKS: {}}}
+        # Normally shadowed by the specialized forward bound in __init__.
+        return self._select_forward()(batch)
 
-        if has_image:
-            images = batch[self.image_key]
-            image_valid_num = batch[self.image_valid_num_key]
-            assert images.dim() == 5
-            b, n, c, h, w = images.shape
-            steps = torch.arange(0, n).type_as(image_valid_num)
-            image_masks = steps.reshape((1, -1)) < image_valid_num.reshape((-1, 1))  # (b, n)
-            if self.use_learnable_image:
-                images = replace_missing_images_with_learnable(
-                    images=images,
-                    image_masks=image_masks,
-                    learnable_image=self.learnable_image,
-                )
+    def _select_forward(self):
+        """
+        Pick the forward specialized for the modalities this model was built with, so that
+        single-modality models skip the per-call modality checks.
+        """
+        return {
+            (True, False): self._forward_image_only,
+            (False, True): self._forward_text_only,
+            (True, True): self._forward_both,
+            (False, False): self._forward_both,
+        }[(bool(self.has_image), bool(self.has_text))]
+
+    def _get_encoder_precision_context(self, device_type: str):
+        if self.precision is None:
+            return contextlib.nullcontext()
+
+        from ..utils.precision import get_precision_context
+
+        return get_precision_context(precision=self.precision, device_type=device_type)
+
+    @contextlib.contextmanager
+    def _compile_cache_context(self, encoder_name: str):
+        """
+        Point inductor's caches to compile_cache_dir around the first forward of each encoder, which is when the
+        encoders are compiled. The previous settings are restored afterwards since they are process-global, and
+        later forwards run without touching them.
+        """
+        if encoder_name not in self._pending_compile_cache_encoders:
+            yield
+            return
+        self._pending_compile_cache_encoders.discard(encoder_name)
+
+        import torch._inductor.config
+
+        previous_cache_dir = os.environ.get("TORCHINDUCTOR_CACHE_DIR")
+        os.environ["TORCHINDUCTOR_CACHE_DIR"] = self.compile_cache_dir
+        try:
+            with torch._inductor.config.patch(fx_graph_cache=True):
+                yield
+        finally:
+            if previous_cache_dir is None:
+                os.environ.pop("TORCHINDUCTOR_CACHE_DIR", None)
+            else:
+                os.environ["TORCHINDUCTOR_CACHE_DIR"] = previous_cache_dir
+
+    def _get_steps(self, n: int, device: torch.device, dtype: torch.dtype):
+        """
+        Get the tensor [0, 1, ..., n-1] used to build the image and text masks. Image numbers and
+        text lengths rarely change across batches, so the tensors are cached to avoid allocating
+        them in every forward.
+        """
+        key = (n, device, dtype)
+        steps = self._step_cache.get(key)
+        if steps is None:
+            steps = torch.arange(n, device=device, dtype=dtype)
+            self._step_cache[key] = steps
+        return steps
+
+    def _encode_pixel_values(self, pixel_values: torch.Tensor):
+        with (
+            self._compile_cache_context("vision_model"),
+            self._get_encoder_precision_context(pixel_values.device.type),
+        ):
             vision_outputs = self.model.vision_model(
-                pixel_values=images.reshape((b * n, c, h, w)),
-                output_attentions=True,
-                output_hidden_states=True,
+                pixel_values=pixel_values,
+                output_attentions=False,
+                output_hidden_states=False,
             )
             image_features = self.model.visual_projection(vision_outputs.pooler_output)
-            image_features = image_features.reshape((b, n, -1))  # (b, n, num_features)
-            if not self.use_learnable_image:
-                image_features = image_features * image_masks[:, :, None].type_as(image_features)
-
-            # normalized features
-            image_features = image_features / torch.clamp(image_features.norm(dim=-1, keepdim=True), min=1e-6)
-
-            # collect image features by image column names
-            image_column_features, image_column_feature_masks = get_column_features(
-                batch=batch,
-                column_name_prefix=self.image_column_prefix,
-                features=image_features,
-                valid_lengths=image_valid_num,
-            )
-            ret[COLUMN_FEATURES][FEATURES].update(image_column_features)
-            ret[COLUMN_FEATURES][MASKS].update(image_column_feature_masks)
-
-            image_features = image_features.mean(dim=1)  # (b, num_features)
-            ret[FEATURES] = image_features
+        if self.precision is not None:
+            image_features = image_features.to(self.model.visual_projection.weight.dtype)
+        return image_features
 
-        if has_text:
-            text_token_ids = batch[self.text_token_ids_key]
-            text_valid_length = batch[self.text_valid_length_key]
-            steps = torch.arange(0, text_token_ids.shape[1]).type_as(text_valid_length)
-            text_masks = (steps.reshape((1, -1)) < text_valid_length.reshape((-1, 1))).type_as(text_token_ids)
+    def _encode_image(self, batch: dict, ret: dict, allow_sync: bool = True):
+        """
+        Encode the images of a batch. If ``allow_sync`` is False, the valid images are not counted on an
+        accelerator, since reading the count back to the host would block until the queued work is done.
+        """
+        images = batch[self.image_key]
+        image_valid_num = batch[self.image_valid_num_key]
+        assert images.dim() == 5
+        b, n, c, h, w = images.shape
+        steps = self._get_steps(n, device=image_valid_num.device, dtype=image_valid_num.dtype)
+        image_masks = steps.unsqueeze(0) < image_valid_num.unsqueeze(1)  # (b, n)
+        if self.use_learnable_image:
+            images = replace_missing_images_with_learnable(
+                images=images,
+                image_masks=image_masks,
+                learnable_image=self.learnable_image,
+            )
+        pixel_values = images.reshape((b * n, c, h, w))
+        if self.use_learnable_image:
+            image_features = self._encode_pixel_values(pixel_values)
+        elif not allow_sync and image_valid_num.device.type != "cpu":
+            # encode all slots and zero the features of the missing images without leaving the device
+            image_features = self._encode_pixel_values(pixel_values)
+            image_features = image_features * image_masks.view(-1, 1).to(image_features.dtype)
+        else:
+            # only encode the valid images and leave zero features for the missing ones.
+            # counting them is free for CPU tensors, but costs one host-device sync per forward otherwise
+            flat_image_masks = image_masks.view(-1)
+            valid_image_num = int(flat_image_masks.sum())
+            if valid_image_num == b * n:
+                image_features = self._encode_pixel_values(pixel_values)
+            elif valid_image_num > 0:
+                valid_image_features = self._encode_pixel_values(pixel_values[flat_image_masks])
+                image_features = valid_image_features.new_zeros((b * n, valid_image_features.shape[-1]))
+                image_features[flat_image_masks] = valid_image_features
+            else:
+                image_features = pixel_values.new_zeros(
+                    (b * n, self.out_features), dtype=self.model.visual_projection.weight.dtype
+                )
+        image_features = image_features.view((b, n, -1))  # (b, n, num_features)
+        # normalized features (b, n, num_features) and their mean (b, num_features)
+        image_features, mean_image_features = _postprocess_image_features(image_features)
+
+        # collect image features by image column names
+        image_column_features, image_column_feature_masks = get_column_features(
+            batch=batch,
+            column_name_prefix=self.image_column_prefix,
+            features=image_features,
+            valid_lengths=image_valid_num,
+        )
+        ret[COLUMN_FEATURES][FEATURES].update(image_column_features)
+        ret[COLUMN_FEATURES][MASKS].update(image_column_feature_masks)
+
+        return mean_image_features
+
+    def _encode_text(self, batch: dict, ret: dict):
+        text_token_ids = batch[self.text_token_ids_key]
+        text_valid_length = batch[self.text_valid_length_key]
+        steps = self._get_steps(
+            text_token_ids.shape[1], device=text_valid_length.device, dtype=text_valid_length.dtype
+        )
+        text_masks = (steps.unsqueeze(0) < text_valid_length.unsqueeze(1)).to(text_token_ids.dtype)
+        if logger.isEnabledFor(logging.DEBUG):
+            # the check forces a device sync, so only run it when debugging
             assert torch.equal(text_valid_length, text_masks.sum(dim=-1))
 
+        # the token-level projection is only needed if the batch has text columns to index
+        text_column_keys = [k for k in batch if k.startswith(self.text_column_prefix)]
+        has_text_columns = len(text_column_keys) > 0
+        with (
+            self._compile_cache_context("text_model"),
+            self._get_encoder_precision_context(text_token_ids.device.type),
+        ):
             text_outputs = self.model.text_model(
                 input_ids=text_token_ids,
                 attention_mask=text_masks,
-                output_attentions=True,
-                output_hidden_states=True,
+                output_attentions=False,
+                output_hidden_states=False,
             )
             text_features = self.model.text_projection(text_outputs.pooler_output)  # (b, num_features)
+            if has_text_columns:
+                token_features = self.model.text_projection(text_outputs.last_hidden_state)
+        if self.precision is not None:
+            text_features = text_features.to(self.model.text_projection.weight.dtype)
+            if has_text_columns:
+                token_features = token_features.to(self.model.text_projection.weight.dtype)
+
+        # normalized features
+        text_features = _normalize_text_features(text_features)
+        if not has_text_columns:
+            token_features = text_features.unsqueeze(1)
+
+        # collect text features by text column names
+        text_column_features, text_column_feature_masks = get_column_features(
+            batch=batch,
+            column_name_prefix=self.text_column_prefix,
+            features=token_features,
+            valid_lengths=text_valid_length,
+            cls_feature=text_features,
+            column_keys=text_column_keys,
+        )
+        ret[COLUMN_FEATURES][FEATURES].update(text_column_features)
+        ret[COLUMN_FEATURES][MASKS].update(text_column_feature_masks)
+
+        return text_features
+
+    def _encode_image_and_text_concurrently(self, batch: dict, ret: dict):
+        """
+        Run the two independent encoders on separate CUDA streams so that they can overlap on the GPU.
+        Used for matching, where both towers run on every pair.
+        """
+        device = batch[self.image_key].device
+        if device not in self._encoder_streams:
+            self._encoder_streams[device] = (torch.cuda.Stream(device=device), torch.cuda.Stream(device=device))
+        vision_stream, text_stream = self._encoder_streams[device]
+
+        current_stream = torch.cuda.current_stream(device)
+        # the inputs are produced on the current stream
+        vision_stream.wait_stream(current_stream)
+        text_stream.wait_stream(current_stream)
+        with torch.cuda.stream(vision_stream):
+            # a host-device sync here would serialize the two streams
+            image_features = self._encode_image(batch, ret, allow_sync=False)
+        with torch.cuda.stream(text_stream):
+            text_features = self._encode_text(batch, ret)
+        current_stream.wait_stream(vision_stream)
+        current_stream.wait_stream(text_stream)
+
+        return image_features, text_features
+
+    def _forward_image_only(self, batch: dict):
+        ret = {COLUMN_FEATURES: {FEATURES: {}, MASKS: {}}}
+        image_features = self._encode_image(batch, ret)
+        ret[FEATURES] = image_features
+        if self.num_classes:
+            ret[LOGITS] = self.head(image_features)
+        else:
+            ret[LOGIT_SCALE] = self.model.logit_scale.exp()
 
-            # normalized features
-            text_features = text_features / text_features.norm(dim=-1, keepdim=True)
+        return {self.prefix: ret}
 
-            # collect text features by text column names
-            text_column_features, text_column_feature_masks = get_column_features(
-                batch=batch,
-                column_name_prefix=self.text_column_prefix,
-                features=self.model.text_projection(text_outputs.last_hidden_state),
-                valid_lengths=text_valid_length,
-                cls_feature=text_features,
-            )
-            ret[COLUMN_FEATURES][FEATURES].update(text_column_features)
-            ret[COLUMN_FEATURES][MASKS].update(text_column_feature_masks)
+    def _forward_text_only(self, batch: dict):
+        ret = {COLUMN_FEATURES: {FEATURES: {}, MASKS: {}}}
+        text_features = self._encode_text(batch, ret)
+        ret[FEATURES] = text_features
+        if self.num_classes:
+            ret[LOGITS] = self.head(text_features)
+        else:
+            ret[LOGIT_SCALE] = self.model.logit_scale.exp()
+
+        return {self.prefix: ret}
+
+    def _forward_both(self, batch: dict):
+        # both encoders exist, but a batch may still carry only one modality, e.g., in matching
+        has_image = self.image_key in batch
+        has_text = self.text_token_ids_key in batch
+        ret = {COLUMN_FEATURES: {FEATURES: {}, MASKS: {}}}
+
+        if self.is_matching and has_image and has_text and batch[self.image_key].is_cuda:
+            image_features, text_features = self._encode_image_and_text_concurrently(batch, ret)
             ret[FEATURES] = text_features
+        else:
+            if has_image:
+                image_features = self._encode_image(batch, ret)
+                ret[FEATURES] = image_features
+
+            if has_text:
+                text_features = self._encode_text(batch, ret)
+                ret[FEATURES] = text_features
 
         if self.num_classes:
             if has_image and has_text:
@@ -279,7 +534,7 @@ class CLIPForImageText(nn.Module):
             ret[LOGIT_SCALE] = self.model.logit_scale.exp()
             if has_image and has_text:
                 # cosine similarity as logits
-                logits = torch.sum(image_features * text_features, dim=-1)
+                logits = torch.einsum("bd,bd->b", image_features, text_features)
                 ret[LOGITS] = logits
 
         return {self.prefix: ret}
@@ -307,17 +562,34 @@ class CLIPForImageText(nn.Module):
 
         pre_encoder_patterns = ("embeddings", "pre")
         post_encoder_patterns = ("head", "final", "post", "logit", "project")
-        names = [n for n, _ in self.named_parameters()]
+
+        # partition the parameter names by their first matching prefix in one pass,
+        # instead of letting every prefix rescan the remaining names
+        groups = {per_prefix: [] for per_prefix in model_prefixes}
+        names = []
+        for n, _ in self.named_parameters():
+            matched_prefix = next((pre for pre in model_prefixes if n.startswith(pre)), None)
+            if matched_prefix is None:
+                names.append(n)
+            else:
+                groups[matched_prefix].append(n)
 
         name_to_id = {}
-        for per_prefix in model_prefixes:
-            per_model_name_to_id, names = assign_layer_ids(
-                names=names,
+        for i, per_prefix in enumerate(model_prefixes):
+            per_model_name_to_id, left_names = assign_layer_ids(
+                names=groups[per_prefix],
                 pre_encoder_patterns=pre_encoder_patterns,
                 post_encoder_patterns=post_encoder_patterns,
                 model_pre=per_prefix,
             )
             name_to_id.update(per_model_name_to_id)
+            # names failing to get ids fall through to the later prefixes
+            for n in left_names:
+                next_prefix = next((pre for pre in model_prefixes[i + 1 :] if n.startswith(pre)), None)
+                if next_prefix is None:
+                    names.append(n)
+                else:
+                    groups[next_prefix].append(n)
 
         if len(names) > 0:
             logger.debug(f"outer layers are treated as head: {names}")
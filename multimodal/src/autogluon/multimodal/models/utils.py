@@ -409,6 +409,7 @@ def get_column_features(
     features: torch.Tensor,
     valid_lengths: torch.Tensor,
     cls_feature: Optional[torch.Tensor] = None,
+    column_keys: Optional[List[str]] = None,
 ):
     """
     Index the features of one column defined by `column_name_prefix`.
@@ -429,6 +430,9 @@ def get_column_features(
         The valid image number or text token number of each sample in a batch.
     cls_feature
         The cls feature containing information from all feature columns.
+    column_keys
+        The batch keys starting with `column_name_prefix`, if already collected by the caller.
+        If None, they are collected from the batch.
 
     Returns
     -------
@@ -442,28 +446,29 @@ def get_column_features(
     if cls_feature is not None:
         all_column_names = []
         # create a zero mask to do logical_or with each column's mask
-        joint_mask = torch.zeros(features.shape[0]).to(features)  # (b,)
-    for key in batch:
-        if key.startswith(column_name_prefix):
-            per_col_features = []
-            per_col_masks = torch.zeros(features.shape[0]).to(features)  # (b,)
-            assert batch[key].ndim == 2 and batch[key].shape[1] == 2
-            for i, per_sample_col_idx in enumerate(batch[key]):
-                start_idx = per_sample_col_idx[0]
-                end_idx = per_sample_col_idx[1]
-                if start_idx < end_idx:
-                    assert end_idx <= valid_lengths[i]
-                    per_col_features.append(features[i, start_idx:end_idx].mean(dim=0))
-                    per_col_masks[i] = 1
-                else:  # the column has no valid image/text.
-                    per_col_features.append(torch.zeros_like(features[0, 0]))
-                    per_col_masks[i] = 0
-            column_name = key[cut_idx:]
-            column_features[column_name] = torch.stack(per_col_features, dim=0)  # (b, num_features)
-            feature_masks[column_name] = per_col_masks  # (b,)
-            if cls_feature is not None:
-                all_column_names.append(column_name)
-                joint_mask = torch.logical_or(joint_mask, per_col_masks)
+        joint_mask = features.new_zeros(features.shape[0])  # (b,)
+    if column_keys is None:
+        column_keys = [key for key in batch if key.startswith(column_name_prefix)]
+    for key in column_keys:
+        per_col_features = []
+        per_col_masks = features.new_zeros(features.shape[0])  # (b,)
+        assert batch[key].ndim == 2 and batch[key].shape[1] == 2
+        for i, per_sample_col_idx in enumerate(batch[key]):
+            start_idx = per_sample_col_idx[0]
+            end_idx = per_sample_col_idx[1]
+            if start_idx < end_idx:
+                assert end_idx <= valid_lengths[i]
+                per_col_features.append(features[i, start_idx:end_idx].mean(dim=0))
+                per_col_masks[i] = 1
+            else:  # the column has no valid image/text.
+                per_col_features.append(torch.zeros_like(features[0, 0]))
+                per_col_masks[i] = 0
+        column_name = key[cut_idx:]
+        column_features[column_name] = torch.stack(per_col_features, dim=0)  # (b, num_features)
+        feature_masks[column_name] = per_col_masks  # (b,)
+        if cls_feature is not None:
+            all_column_names.append(column_name)
+            joint_mask = torch.logical_or(joint_mask, per_col_masks)
 
     # all the columns of one model's input share the model's cls feature
     if (
@@ -621,7 +626,10 @@ def get_model_head(model: nn.Module):
 
 
 def get_hf_config_and_model(
-    checkpoint_name: str, pretrained: Optional[bool] = True, low_cpu_mem_usage: Optional[bool] = False
+    checkpoint_name: str,
+    pretrained: Optional[bool] = True,
+    low_cpu_mem_usage: Optional[bool] = False,
+    attn_implementation: Optional[str] = None,
 ):
     """
     Get a Huggingface config and model based on a checkpoint name.
@@ -634,6 +642,8 @@ def get_hf_config_and_model(
          Whether using the pretrained weights. If pretrained=True, download the pretrained model.
     low_cpu_mem_usage
         Whether to turn on the optimization of reducing the peak CPU memory usage when loading the pretrained model.
+    attn_implementation
+        The attention implementation, e.g., "sdpa", passed to huggingface. If None, huggingface picks the default.
 
     Returns
     -------
@@ -641,10 +651,13 @@ def get_hf_config_and_model(
     """
     config = AutoConfig.from_pretrained(checkpoint_name)    # nosec B615
 
+    model_kwargs = {}
+    if attn_implementation is not None:
+        model_kwargs["attn_implementation"] = attn_implementation
     if pretrained:
-        model = AutoModel.from_pretrained(checkpoint_name, low_cpu_mem_usage=low_cpu_mem_usage) # nosec B615
+        model = AutoModel.from_pretrained(checkpoint_name, low_cpu_mem_usage=low_cpu_mem_usage, **model_kwargs) # nosec B615
     else:
-        model = AutoModel.from_config(config)
+        model = AutoModel.from_config(config, **model_kwargs)
     # Explicitly set the model to train mode after loading as by default it is in eval mode
     # See issue #4965
     model.train()
@@ -1163,10 +1176,9 @@ def replace_missing_images_with_learnable(
 ):
     b, n, c, h, w = images.shape
     assert learnable_image.shape == (c, h, w)
-    for i in range(b):
-        for j in range(n):
-            if not image_masks[i][j]:  # False means a missing image
-                images[i][j] = learnable_image
+    # False in image_masks means a missing image.
+    # A single broadcasted select avoids reading every mask element back to the host.
+    images = torch.where(image_masks[:, :, None, None, None], images, learnable_image.to(images.dtype))
 
     return images
 
@@ -1322,6 +1334,9 @@ def create_model(
             max_text_len=model_config.max_text_len,
             text_segment_num=model_config.text_segment_num,
             is_matching=is_matching,
+            compile_mode=getattr(model_config, "compile_mode", None),
+            compile_cache_dir=getattr(model_config, "compile_cache_dir", None),
+            precision=getattr(model_config, "precision", None),
         )
     elif model_name.lower().startswith(TIMM_IMAGE):
         from .timm_image import TimmAutoModelForImagePrediction
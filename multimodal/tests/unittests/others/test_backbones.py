@@ -5,8 +5,13 @@ import pytest
 from datasets import load_dataset
 
 from autogluon.multimodal import MultiModalPredictor
-from autogluon.multimodal.constants import IA3_LORA
-from autogluon.multimodal.models import HFAutoModelForTextPrediction, TimmAutoModelForImagePrediction
+from autogluon.multimodal.constants import IA3_LORA, LORA
+from autogluon.multimodal.models import (
+    CLIPForImageText,
+    HFAutoModelForTextPrediction,
+    TimmAutoModelForImagePrediction,
+)
+from autogluon.multimodal.models.utils import inject_adaptation_to_linear_layer
 from autogluon.multimodal.utils import download
 
 from ..utils import PetFinderDataset, get_home_dir, verify_no_redundant_model_configs, verify_predictor_save_load
@@ -67,6 +72,19 @@ def test_backbone_bart(checkpoint_name, peft):
     predictor.predict(test_data)
 
 
+@pytest.mark.parametrize("peft", [LORA, IA3_LORA])
+def test_clip_layer_ids_include_peft_parameters(peft):
+    model = CLIPForImageText(prefix="clip", checkpoint_name="openai/clip-vit-base-patch32")
+    model = inject_adaptation_to_linear_layer(
+        model=model, peft=peft, lora_r=8, lora_alpha=8, filter=["q_proj", "v_proj"]
+    )
+    model.name_to_id = model.get_layer_ids()
+
+    param_names = [n for n, _ in model.named_parameters()]
+    assert any("lora" in n for n in param_names)
+    assert all(n in model.name_to_id for n in param_names)
+
+
 @pytest.mark.skip(
     reason="Skip this test because the meta-transformer checkpoint needs to be put into the s3 bucket first."
 )
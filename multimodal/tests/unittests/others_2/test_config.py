@@ -161,3 +161,19 @@ def test_none_str_config(overrides):
         assert config.optim.peft is None
     if "data.label.numerical_preprocessing" in overrides:
         assert config.data.label.numerical_preprocessing is None
+
+
+@pytest.mark.parametrize(
+    "key,value",
+    [
+        ("compile_mode", "reduce-overhead"),
+        ("compile_cache_dir", "/tmp/clip_compile_cache"),
+        ("precision", "bf16"),
+    ],
+)
+def test_clip_encoder_options_can_be_overridden(key, value):
+    config = get_config(overrides={"model.names": ["clip"]})
+    assert config.model.clip[key] is None
+
+    config = get_config(overrides={"model.names": ["clip"], f"model.clip.{key}": value})
+    assert config.model.clip[key] == value
@@ -1116,7 +1116,11 @@ class TimeSeriesDataFrame(pd.DataFrame):
 
         This method assumes that the TimeSeriesDataFrame is sorted by [item_id, timestamp].
         """
-        return np.concatenate([[0], np.cumsum(self.num_timesteps_per_item().to_numpy())]).astype(np.int32)
+        num_timesteps_per_item = self.num_timesteps_per_item().to_numpy()
+        indptr = np.empty(len(num_timesteps_per_item) + 1, dtype=np.int32)
+        indptr[0] = 0
+        np.cumsum(num_timesteps_per_item, out=indptr[1:])
+        return indptr
 
     # inline typing stubs for various overridden methods
     if TYPE_CHECKING:
@@ -1,8 +1,12 @@
+import contextlib
+import functools
 import logging
 import os
 import shutil
 import warnings
+import weakref
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import numpy as np
@@ -11,6 +15,7 @@ from typing_extensions import Self
 
 from autogluon.common.loaders import load_pkl
 from autogluon.common.space import Space
+from autogluon.common.utils.resource_utils import ResourceManager
 from autogluon.timeseries.dataset import TimeSeriesDataFrame
 from autogluon.timeseries.models.abstract import AbstractTimeSeriesModel
 from autogluon.timeseries.utils.warning_filters import disable_duplicate_logs, warning_filter
@@ -81,6 +86,18 @@ MODEL_ALIASES = {
 }
 
 
+def _cpu_supports_vnni() -> bool:
+    """Check if the CPU supports int8 dot product (AVX512-VNNI or AVX-VNNI) instructions. Returns True if
+    this cannot be determined, e.g., on platforms other than Linux.
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpuinfo = f.read()
+    except OSError:
+        return True
+    return "avx512_vnni" in cpuinfo or "avx_vnni" in cpuinfo
+
+
 class ChronosModel(AbstractTimeSeriesModel):
     """Chronos [Ansari2024]_ pretrained time series forecasting models which can be used for zero-shot
     forecasting or fine-tuned in a task-specific manner.
@@ -135,6 +152,9 @@ class ChronosModel(AbstractTimeSeriesModel):
         For Chronos-Bolt models the ``batch_size`` is set to 256. However, ``batch_size`` is reduced by
         a factor of 4 when the prediction horizon is greater than the model's
         default prediction length.
+
+        If ``batch_size`` is not provided and inference is performed on a GPU, the default batch size is
+        increased by up to a factor of 4 depending on the free GPU memory.
     num_samples : int, default = 20
         Number of samples used during inference, only used for the original Chronos models
     device : str, default = None
@@ -160,9 +180,25 @@ class ChronosModel(AbstractTimeSeriesModel):
         Torch data type for model weights, provided to ``from_pretrained`` method of Hugging Face
         AutoModels. If original Chronos models are specified and the model size is ``small``, ``base``,
         or ``large``, the ``torch_dtype`` will be set to ``bfloat16`` to enable inference on GPUs.
-    data_loader_num_workers : int, default = 0
-        Number of worker processes to be used in the data loader. See documentation on
-        ``torch.utils.data.DataLoader`` for more information.
+
+        If ``"auto"`` results in ``float32`` weights and inference is performed on a GPU supporting ``bfloat16``,
+        inference runs under ``bfloat16`` autocast. Set ``torch_dtype="float32"`` to run inference in full precision.
+    data_loader_num_workers : int or None, default = None
+        Number of worker processes to be used in the data loader during inference. See documentation on
+        ``torch.utils.data.DataLoader`` for more information. If None, the number of workers is selected
+        automatically: ``min(num_cpus // 2, 8)`` when inference runs on a GPU and 0 (i.e., data is loaded in the
+        main process) when it runs on the CPU. During fine-tuning, None is treated as 0.
+    optimization_strategy : {None, "int8"}, default = None
+        Optimization applied to the model weights for CPU inference. If ``"int8"``, the linear layers of the
+        model are dynamically quantized to int8 with ``torch.ao.quantization.quantize_dynamic``, which is
+        considerably faster on CPUs supporting AVX512-VNNI or AVX-VNNI instructions at the cost of a small
+        loss in accuracy. The option is ignored if inference is performed on a GPU or the model weights are
+        not ``float32``.
+    compile_model : bool, default = False
+        If True and inference is performed on a GPU, the model is compiled with ``torch.compile`` after loading,
+        which reduces kernel launch overhead for small batches. Compilation takes place during the first call
+        to predict and may take a while, so it is only worthwhile if the model is used to predict many times.
+        Errors raised during compilation are not caught and cause the call to predict to fail.
     fine_tune : bool, default = False
         If True, the pretrained model will be fine-tuned
     fine_tune_lr : float, default = 1e-5
@@ -196,6 +232,24 @@ class ChronosModel(AbstractTimeSeriesModel):
     default_max_time_limit_ratio = 0.8
     maximum_context_length = 2048
     fine_tuned_ckpt_name: str = "fine-tuned-ckpt"
+    # upper bound on the memory used to precompute the padded contexts of all items for inference
+    max_eager_pad_bytes: int = 512 * 1024**2
+    # trainer arguments that do not depend on the hyperparameters
+    _static_fine_tune_trainer_kwargs: MappingProxyType = MappingProxyType(
+        dict(
+            lr_scheduler_type="linear",
+            warmup_ratio=0.0,
+            optim="adamw_torch_fused",
+            logging_strategy="steps",
+            logging_steps=100,
+            disable_tqdm=True,
+            report_to="none",
+            gradient_accumulation_steps=1,
+            save_only_model=True,
+            prediction_loss_only=True,
+            save_total_limit=1,
+        )
+    )
 
     def __init__(
         self,
@@ -211,6 +265,8 @@ class ChronosModel(AbstractTimeSeriesModel):
 
         model_path_input: str = hyperparameters.get("model_path", self.default_model_path)
         self.model_path: str = MODEL_ALIASES.get(model_path_input, model_path_input)
+        # (model_path, config) of the last lookup, the model_path changes when a fine-tuned model is loaded
+        self._ag_default_config_cache: tuple[Any, dict[str, Any]] | None = None
 
         name = name if name is not None else "Chronos"
         if not isinstance(model_path_input, Space):
@@ -230,6 +286,10 @@ class ChronosModel(AbstractTimeSeriesModel):
         )
 
         self._model_pipeline: Any | None = None  # of type BaseChronosPipeline
+        self.optimization_strategy: str | None = None
+        self.compile_model: bool = False
+        # (weakref to data.index, prediction_length, freq, forecast index) of the last predict call
+        self._forecast_horizon_index_cache: tuple | None = None
 
     def save(self, path: str | None = None, verbose: bool = True) -> str:
         pipeline = self._model_pipeline
@@ -239,6 +299,12 @@ class ChronosModel(AbstractTimeSeriesModel):
 
         return str(path)
 
+    def __getstate__(self) -> dict:
+        # weak references cannot be pickled, so the forecast index cache is dropped when the model is serialized
+        state = self.__dict__.copy()
+        state["_forecast_horizon_index_cache"] = None
+        return state
+
     @classmethod
     def load(cls, path: str, reset_paths: bool = True, load_oof: bool = False, verbose: bool = True) -> Self:
         model = load_pkl.load(path=os.path.join(path, cls.model_file_name), verbose=verbose)
@@ -269,10 +335,15 @@ class ChronosModel(AbstractTimeSeriesModel):
         """The default configuration of the model used by AutoGluon if the model is one of those
         defined in MODEL_CONFIGS. For now, these are ``autogluon/chronos-t5-*`` family of models.
         """
-        for k in MODEL_CONFIGS:
-            if k in self.model_path:
-                return MODEL_CONFIGS[k]
-        return {}
+        if self._ag_default_config_cache is None or self._ag_default_config_cache[0] != self.model_path:
+            config = {}
+            if isinstance(self.model_path, str):
+                for k in MODEL_CONFIGS:
+                    if k in self.model_path:
+                        config = MODEL_CONFIGS[k]
+                        break
+            self._ag_default_config_cache = (self.model_path, config)
+        return self._ag_default_config_cache[1]
 
     @property
     def min_num_gpus(self) -> int:
@@ -324,14 +395,75 @@ class ChronosModel(AbstractTimeSeriesModel):
             revision=self.get_hyperparameter("revision"),
         )
 
+        if not is_training and self.optimization_strategy == "int8":
+            self._quantize_model_pipeline(pipeline)
+        if not is_training and self.compile_model:
+            self._compile_model_pipeline(pipeline)
+
         self._model_pipeline = pipeline
 
+    @staticmethod
+    def _quantize_model_pipeline(pipeline: Any) -> None:
+        import torch
+
+        inner_model = pipeline.inner_model
+        if inner_model.device.type != "cpu" or inner_model.dtype != torch.float32:
+            logger.debug(
+                f"\tSkipping int8 quantization, which requires a float32 model on the CPU "
+                f"(got {inner_model.dtype} on {inner_model.device})"
+            )
+            return
+
+        if not _cpu_supports_vnni():
+            logger.warning(
+                "\tThe CPU does not appear to support VNNI instructions. int8 quantization may be slower than float32."
+            )
+        torch.ao.quantization.quantize_dynamic(inner_model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+    @staticmethod
+    def _compile_model_pipeline(pipeline: Any) -> None:
+        inner_model = pipeline.inner_model
+        if inner_model.device.type != "cuda":
+            logger.debug("\tSkipping torch.compile since the model is not on a GPU")
+            return
+
+        # compile in place so that attributes of the model (config, generate, ...) remain accessible;
+        # dynamic shapes avoid recompiling for every context length and prediction length.
+        # compilation is lazy, so errors are only raised by the first forward pass and are not caught
+        inner_model.compile(dynamic=True)
+
     def persist(self) -> "ChronosModel":
         # TODO: Check the model has been fit before persist
         self.load_model_pipeline()
+        self._warm_up_model_pipeline()
         return self
 
-    def _has_tf32(self):
+    def _warm_up_model_pipeline(self) -> None:
+        """Run the pipeline once on a dummy batch so that lazy initialization (e.g., kernel selection, or
+        compilation if ``compile_model=True``) does not slow down the first call to predict. The batch has the
+        batch size and context length used by predict for series longer than the context length, and is run
+        under the same autocast context.
+        """
+        import torch
+        from chronos import ChronosPipeline
+
+        context_length = self.context_length or self.maximum_context_length
+        batch_size = self._get_inference_batch_size(context_length)
+        extra_predict_kwargs = (
+            {"num_samples": self.num_samples} if isinstance(self.model_pipeline, ChronosPipeline) else {}
+        )
+        with torch.inference_mode(), self._get_autocast_context(), warning_filter(all_warnings=True):
+            self.model_pipeline.predict_quantiles(
+                torch.zeros((batch_size, context_length), dtype=torch.float32),
+                prediction_length=self.prediction_length,
+                quantile_levels=self.quantile_levels,
+                **extra_predict_kwargs,
+            )
+
+    @staticmethod
+    @functools.cache
+    def _has_tf32() -> bool:
+        # cached per process, the device capability does not change while the process is running
         import torch.cuda
 
         return torch.cuda.is_available() and torch.cuda.get_device_capability()[0] >= 8
@@ -354,8 +486,10 @@ class ChronosModel(AbstractTimeSeriesModel):
             "num_samples": self.default_num_samples,
             "device": None,
             "torch_dtype": self.default_torch_dtype,
-            "data_loader_num_workers": 0,
+            "data_loader_num_workers": None,
             "context_length": None,
+            "optimization_strategy": None,
+            "compile_model": False,
             "fine_tune": False,
             "keep_transformers_logs": False,
             "fine_tune_lr": 1e-5,
@@ -377,6 +511,8 @@ class ChronosModel(AbstractTimeSeriesModel):
             "context_length",
             "torch_dtype",
             "data_loader_num_workers",
+            "optimization_strategy",
+            "compile_model",
             "fine_tune",
             "fine_tune_lr",
             "fine_tune_steps",
@@ -392,25 +528,16 @@ class ChronosModel(AbstractTimeSeriesModel):
     def _get_fine_tune_trainer_kwargs(self, init_args, eval_during_fine_tune: bool):
         output_dir = Path(self.path) / "transformers_logs"
         fine_tune_trainer_kwargs = dict(
+            **self._static_fine_tune_trainer_kwargs,
             output_dir=str(output_dir),
             per_device_train_batch_size=init_args["fine_tune_batch_size"],
             per_device_eval_batch_size=init_args["fine_tune_batch_size"],
             learning_rate=init_args["fine_tune_lr"],
-            lr_scheduler_type="linear",
-            warmup_ratio=0.0,
-            optim="adamw_torch_fused",
             logging_dir=str(output_dir),
-            logging_strategy="steps",
-            logging_steps=100,
-            disable_tqdm=True,
-            report_to="none",
             max_steps=init_args["fine_tune_steps"],
-            gradient_accumulation_steps=1,
-            dataloader_num_workers=init_args["data_loader_num_workers"],
+            dataloader_num_workers=init_args["data_loader_num_workers"] or 0,
+            dataloader_persistent_workers=(init_args["data_loader_num_workers"] or 0) > 0,
             tf32=self._has_tf32(),
-            save_only_model=True,
-            prediction_loss_only=True,
-            save_total_limit=1,
             save_strategy="steps" if eval_during_fine_tune else "no",
             save_steps=100 if eval_during_fine_tune else None,
             evaluation_strategy="steps" if eval_during_fine_tune else "no",
@@ -431,7 +558,14 @@ class ChronosModel(AbstractTimeSeriesModel):
         self.device = model_params["device"]
         self.torch_dtype = model_params["torch_dtype"]
         self.data_loader_num_workers = model_params["data_loader_num_workers"]
+        if self.data_loader_num_workers is None:
+            self.data_loader_num_workers = self._get_default_data_loader_num_workers()
         self.context_length = model_params["context_length"]
+        self.optimization_strategy = model_params["optimization_strategy"]
+        self.compile_model = model_params["compile_model"]
+
+        if self.optimization_strategy not in (None, "int8"):
+            raise ValueError(f"optimization_strategy must be one of [None, 'int8'], got {self.optimization_strategy}")
 
         if self.context_length is not None and self.context_length > self.maximum_context_length:
             logger.info(
@@ -440,6 +574,14 @@ class ChronosModel(AbstractTimeSeriesModel):
             )
             self.context_length = self.maximum_context_length
 
+    def _get_default_data_loader_num_workers(self) -> int:
+        """Number of data loader workers used for inference if ``data_loader_num_workers`` is not provided."""
+        if self._is_gpu_available() and (self.device is None or str(self.device).startswith("cuda")):
+            return max(1, min(ResourceManager.get_cpu_count() // 2, 8))
+        # worker processes compete with the model for the CPU, and starting them with the spawn method (e.g., on
+        # macOS and Windows) re-imports the user's script
+        return 0
+
     def _fit(
         self,
         train_data: TimeSeriesDataFrame,
@@ -523,6 +665,8 @@ class ChronosModel(AbstractTimeSeriesModel):
 
             fine_tune_trainer_kwargs = model_params["fine_tune_trainer_kwargs"]
             fine_tune_trainer_kwargs["use_cpu"] = str(self.model_pipeline.inner_model.device) == "cpu"
+            # pinned memory only helps when batches are copied to a GPU
+            fine_tune_trainer_kwargs.setdefault("dataloader_pin_memory", not fine_tune_trainer_kwargs["use_cpu"])
 
             if fine_tune_trainer_kwargs["use_cpu"]:
                 logger.info(
@@ -574,10 +718,13 @@ class ChronosModel(AbstractTimeSeriesModel):
                 )
 
                 if fine_tune_eval_max_items < val_data.num_items:
-                    eval_items = np.random.choice(
-                        val_data.item_ids.values, size=fine_tune_eval_max_items, replace=False
+                    # Generator.choice samples k of N items without replacement in O(k) time when k << N,
+                    # and is seeded from the global RNG to stay reproducible under seed_everything
+                    rng = np.random.default_rng(np.random.randint(np.iinfo(np.int32).max))
+                    eval_item_idx = rng.choice(
+                        val_data.num_items, size=fine_tune_eval_max_items, replace=False, shuffle=False
                     )
-                    val_data = val_data.loc[eval_items]
+                    val_data = val_data.loc[val_data.item_ids[np.sort(eval_item_idx)]]
 
                 assert isinstance(val_data, TimeSeriesDataFrame)
                 tokenizer_val_dataset = ChronosFineTuningDataset(
@@ -613,6 +760,8 @@ class ChronosModel(AbstractTimeSeriesModel):
             fine_tuned_ckpt_path = Path(self.path) / self.fine_tuned_ckpt_name
             logger.info(f"\tSaving fine-tuned model to {fine_tuned_ckpt_path}")
             self.model_pipeline.inner_model.save_pretrained(Path(self.path) / self.fine_tuned_ckpt_name)
+            if self.optimization_strategy == "int8":
+                self._quantize_model_pipeline(self.model_pipeline)
 
             if not model_params["keep_transformers_logs"]:
                 logger.debug(f"Removing transformers_logs directory {output_dir}")
@@ -626,29 +775,126 @@ class ChronosModel(AbstractTimeSeriesModel):
         num_workers: int = 0,
         time_limit: float | None = None,
     ):
+        import torch
+
         from .utils import ChronosInferenceDataLoader, ChronosInferenceDataset, timeout_callback
 
+        # pad all contexts at once if the padded (num_items, context_length) float32 array is small enough
+        eager_pad_bytes = data.num_items * context_length * 4
+        eager_pad = eager_pad_bytes <= min(self.max_eager_pad_bytes, 0.1 * ResourceManager.get_available_virtual_mem())
         chronos_dataset = ChronosInferenceDataset(
             target_df=data,
             target_column=self.target,
             context_length=context_length,
+            eager_pad=eager_pad,
         )
+        # avoid spawning workers that would never receive a full batch
+        num_workers = min(num_workers, len(chronos_dataset) // batch_size)
+
+        # pinned host memory allows the batches to be copied to the GPU asynchronously
+        pin_memory = self.model_pipeline.inner_model.device.type == "cuda"
 
         return ChronosInferenceDataLoader(
             chronos_dataset,
             batch_size=batch_size,
             shuffle=False,
             num_workers=num_workers,
+            pin_memory=pin_memory,
+            # ChronosInferenceDataset.__getitems__ already returns the stacked batch
+            collate_fn=torch.from_numpy,
             after_batch=timeout_callback(seconds=time_limit),
         )
 
     def _get_context_length(self, data: TimeSeriesDataFrame) -> int:
         context_length = self.context_length or min(
-            data.num_timesteps_per_item().max(),
+            # length of the longest series, without building the per-item Series of num_timesteps_per_item()
+            int(np.bincount(data.index.codes[0]).max()),
             self.maximum_context_length,
         )
         return context_length
 
+    def get_forecast_horizon_index(self, data: TimeSeriesDataFrame) -> pd.MultiIndex:
+        # The forecast index only depends on the (immutable) index of the data, so it is reused when predict is
+        # called repeatedly on the same data, e.g., during backtesting
+        if self._forecast_horizon_index_cache is not None:
+            index_ref, prediction_length, freq, forecast_index = self._forecast_horizon_index_cache
+            if index_ref() is data.index and prediction_length == self.prediction_length and freq == self.freq:
+                return forecast_index
+
+        forecast_index = super().get_forecast_horizon_index(data)
+        self._forecast_horizon_index_cache = (
+            weakref.ref(data.index),
+            self.prediction_length,
+            self.freq,
+            forecast_index,
+        )
+        return forecast_index
+
+    def _get_inference_batch_size(self, context_length: int) -> int:
+        from chronos import ChronosBoltPipeline
+
+        batch_size = self.batch_size
+        if "batch_size" not in self._hyperparameters:
+            batch_size = self._get_batch_size_for_available_gpu_memory(context_length)
+
+        # adapt batch size for Chronos bolt if requested prediction length is longer than model prediction length
+        model_prediction_length = None
+        if isinstance(self.model_pipeline, ChronosBoltPipeline):
+            model_prediction_length = self.model_pipeline.model.config.chronos_config.get("prediction_length")
+        if model_prediction_length and self.prediction_length > model_prediction_length:
+            batch_size = max(1, batch_size // 4)
+            logger.debug(
+                f"\tThe prediction_length {self.prediction_length} exceeds model's prediction_length {model_prediction_length}. "
+                f"The inference batch_size has been reduced to {batch_size} to avoid OOM errors."
+            )
+        return batch_size
+
+    def _get_batch_size_for_available_gpu_memory(self, context_length: int) -> int:
+        """Scale up the default inference batch size based on the free GPU memory, up to 4x the default batch size.
+
+        The activation memory per series is roughly estimated as ``context_length * d_model * num_layers * dtype_bytes``,
+        and at most 70% of the free memory is used. On the CPU, the default batch size is returned.
+        """
+        import torch
+        from chronos import ChronosPipeline
+
+        inner_model = self.model_pipeline.inner_model
+        if inner_model.device.type != "cuda":
+            return self.batch_size
+
+        config = inner_model.config
+        num_layers = getattr(config, "num_layers", 1) + getattr(config, "num_decoder_layers", 0)
+        bytes_per_series = context_length * getattr(config, "d_model", 512) * num_layers * inner_model.dtype.itemsize
+        if isinstance(self.model_pipeline, ChronosPipeline):
+            # each series is decoded num_samples times in parallel
+            bytes_per_series *= self.num_samples
+
+        free_memory, _ = torch.cuda.mem_get_info(inner_model.device)
+        batch_size = int(0.7 * free_memory / max(bytes_per_series, 1))
+        batch_size = min(max(batch_size, self.batch_size), 4 * self.batch_size)
+        if batch_size != self.batch_size:
+            logger.debug(f"\tInference batch_size increased to {batch_size} based on available GPU memory")
+        return batch_size
+
+    def _get_autocast_context(self):
+        """Returns a bfloat16 autocast context for GPU inference of float32 models loaded with ``torch_dtype="auto"``,
+        and a null context otherwise. float16 is not used since T5 activations overflow in half precision.
+        bfloat16 is only used on GPUs with native support (compute capability 8.0 or higher), since on older GPUs
+        ``torch.cuda.is_bf16_supported()`` also reports emulated support, which is slower than float32.
+        """
+        import torch
+
+        inner_model = self.model_pipeline.inner_model
+        if (
+            isinstance(self.torch_dtype, str)
+            and self.torch_dtype == "auto"
+            and inner_model.dtype == torch.float32
+            and inner_model.device.type == "cuda"
+            and torch.cuda.get_device_capability(inner_model.device)[0] >= 8
+        ):
+            return torch.autocast(device_type="cuda", dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+
     def _predict(
         self,
         data: TimeSeriesDataFrame,
@@ -671,21 +917,13 @@ class ChronosModel(AbstractTimeSeriesModel):
             {"num_samples": self.num_samples} if isinstance(self.model_pipeline, ChronosPipeline) else {}
         )
 
-        # adapt batch size for Chronos bolt if requested prediction length is longer than model prediction length
-        batch_size = self.batch_size
-        model_prediction_length = None
-        if isinstance(self.model_pipeline, ChronosBoltPipeline):
-            model_prediction_length = self.model_pipeline.model.config.chronos_config.get("prediction_length")
-        if model_prediction_length and self.prediction_length > model_prediction_length:
-            batch_size = max(1, batch_size // 4)
-            logger.debug(
-                f"\tThe prediction_length {self.prediction_length} exceeds model's prediction_length {model_prediction_length}. "
-                f"The inference batch_size has been reduced from {self.batch_size} to {batch_size} to avoid OOM errors."
-            )
+        batch_size = self._get_inference_batch_size(context_length)
 
         with warning_filter(all_warnings=True):
             import torch
 
+            from .utils import prefetch_to_device
+
             self.model_pipeline.model.eval()
 
             inference_data_loader = self._get_inference_data_loader(
@@ -696,9 +934,20 @@ class ChronosModel(AbstractTimeSeriesModel):
                 time_limit=kwargs.get("time_limit"),
             )
 
-            with torch.inference_mode(), disable_duplicate_logs(logger):
-                batch_quantiles, batch_means = [], []
-                for batch in inference_data_loader:
+            device = self.model_pipeline.inner_model.device
+            if isinstance(self.model_pipeline, ChronosBoltPipeline):
+                batches = prefetch_to_device(inference_data_loader, device)
+            else:
+                # ChronosPipeline tokenizes the context on the CPU and moves the tokens to the model device itself
+                batches = inference_data_loader
+            # predictions of all batches are written into a single (num_items * prediction_length, 1 + Q) buffer
+            # with the mean in the first column, followed by the quantiles
+            predictions = torch.empty(
+                (data.num_items * self.prediction_length, 1 + len(self.quantile_levels)), dtype=torch.float32
+            )
+            row = 0
+            with torch.inference_mode(), self._get_autocast_context(), disable_duplicate_logs(logger):
+                for batch in batches:
                     try:
                         qs, mn = self.model_pipeline.predict_quantiles(
                             batch,
@@ -712,19 +961,17 @@ class ChronosModel(AbstractTimeSeriesModel):
                             f" predictor.fit(..., hyperparameters={{'Chronos': {{'batch_size': {batch_size // 2}, ...}}}})"
                         )
                         raise ex
-                    batch_quantiles.append(qs.numpy())
-                    batch_means.append(mn.numpy())
+                    num_rows = mn.numel()
+                    predictions[row : row + num_rows, 0].copy_(mn.reshape(-1))
+                    predictions[row : row + num_rows, 1:].copy_(qs.reshape(-1, len(self.quantile_levels)))
+                    row += num_rows
 
         df = pd.DataFrame(
-            np.concatenate(
-                [
-                    np.concatenate(batch_means, axis=0).reshape(-1, 1),
-                    np.concatenate(batch_quantiles, axis=0).reshape(-1, len(self.quantile_levels)),
-                ],
-                axis=1,
-            ),
+            predictions.numpy(),
             columns=["mean"] + [str(q) for q in self.quantile_levels],
             index=self.get_forecast_horizon_index(data),
+            # the buffer is not used after this point, so the frame can take ownership of it
+            copy=False,
         )
 
         return TimeSeriesDataFrame(df)
@@ -1,13 +1,16 @@
 import logging
 import time
-from itertools import chain, cycle
+import weakref
+from functools import reduce
+from itertools import chain, cycle, islice
+from multiprocessing import shared_memory
 from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Literal
 
 import numpy as np
 import torch
 from chronos.chronos_bolt import ChronosBoltModelForForecasting, ResidualBlock
 from gluonts.dataset.field_names import FieldName
-from gluonts.transform import ExpectedNumInstanceSampler, InstanceSplitter, ValidationSplitSampler
+from gluonts.transform import ExpectedNumInstanceSampler, InstanceSplitter
 from torch.utils.data import IterableDataset
 from transformers import TrainerCallback
 
@@ -23,6 +26,19 @@ if TYPE_CHECKING:
 logger = logging.getLogger("autogluon.timeseries.models.chronos")
 
 
+def _as_tensor(array) -> torch.Tensor:
+    """Wrap a numpy array as a tensor without copying it where possible.
+
+    The returned tensor may share memory with the underlying time series of the dataset, so it must not be modified
+    in place. The default collate function stacks the entries of a batch into a new tensor, so this is safe for
+    tensors passed to a ``DataLoader``.
+    """
+    if isinstance(array, np.ndarray) and array.flags.writeable:
+        return torch.from_numpy(np.ascontiguousarray(array))
+    # read-only arrays (e.g., views of pandas data under copy-on-write) are copied to avoid warnings from torch
+    return torch.as_tensor(np.array(array) if isinstance(array, np.ndarray) else array)
+
+
 class PseudoShuffledIterableDataset(IterableDataset):
     """
     Shuffle entries from an iterable by temporarily accumulating them
@@ -34,27 +50,50 @@ class PseudoShuffledIterableDataset(IterableDataset):
         The original iterable object, representing the dataset.
     shuffle_buffer_size
         Size of the buffer use to shuffle entries from the base dataset.
+    seed
+        Seed of the random number generator. Each data loader worker process and each pass over the
+        dataset uses a different random stream derived from this seed.
     """
 
-    def __init__(self, base_dataset, shuffle_buffer_size: int = 100) -> None:
+    def __init__(self, base_dataset, shuffle_buffer_size: int = 100, seed: int = 0) -> None:
         super().__init__()
         assert shuffle_buffer_size > 0
         self.base_dataset = base_dataset
         self.shuffle_buffer_size = shuffle_buffer_size
-        self.generator = torch.Generator()
+        self.seed = seed
+        self._num_iterations = 0
+
+    def _random_indices(self, block_size: int = 4096) -> Iterator[int]:
+        """Yields random non-negative integers, drawn in blocks to amortize the cost of the generator."""
+        worker_info = torch.utils.data.get_worker_info()
+        worker_id = worker_info.id if worker_info is not None else 0
+        rng = np.random.default_rng([self.seed, worker_id, self._num_iterations])
+        self._num_iterations += 1
+        while True:
+            yield from rng.integers(1 << 30, size=block_size).tolist()
 
     def __iter__(self):
-        shuffle_buffer = []
+        # the buffer is allocated once and never resized; the element drawn from it is replaced in-place by
+        # the incoming element, and during the final drain by the last occupied slot
+        shuffle_buffer = [None] * self.shuffle_buffer_size
+        size = 0
+        random_indices = self._random_indices()
 
         for element in self.base_dataset:
-            shuffle_buffer.append(element)
-            if len(shuffle_buffer) >= self.shuffle_buffer_size:
-                idx = torch.randint(len(shuffle_buffer), size=(), generator=self.generator)
-                yield shuffle_buffer.pop(idx)
-
-        while shuffle_buffer:
-            idx = torch.randint(len(shuffle_buffer), size=(), generator=self.generator)
-            yield shuffle_buffer.pop(idx)
+            if size < self.shuffle_buffer_size:
+                shuffle_buffer[size] = element
+                size += 1
+                continue
+            idx = next(random_indices) % size
+            yield shuffle_buffer[idx]
+            shuffle_buffer[idx] = element
+
+        while size > 0:
+            idx = next(random_indices) % size
+            yield shuffle_buffer[idx]
+            size -= 1
+            shuffle_buffer[idx] = shuffle_buffer[size]
+            shuffle_buffer[size] = None
 
 
 class ChronosFineTuningDataset(IterableDataset):
@@ -87,6 +126,11 @@ class ChronosFineTuningDataset(IterableDataset):
         If ``validation``, the last slice of each time series returned in the original order.
     """
 
+    # maximum number of time series for which the GluonTS entries are cached in memory during training
+    max_cached_items: int = 100_000
+    # number of entries passed to the ChronosTokenizer at once
+    tokenizer_batch_size: int = 64
+
     def __init__(
         self,
         target_df: TimeSeriesDataFrame,
@@ -106,13 +150,24 @@ class ChronosFineTuningDataset(IterableDataset):
         self.context_length = context_length
         self.prediction_length = prediction_length
         self.mode = mode
+        # (name, shape) -> float32 buffer that the targets of each tokenizer batch are padded and stacked into
+        self._batch_buffers: dict[tuple[str, tuple[int, int]], torch.Tensor] = {}
+
+    def _get_batch_buffer(self, name: str, tensors: list[torch.Tensor]) -> torch.Tensor:
+        """Returns a buffer for ``left_pad_and_stack_1D(tensors)``, reused across tokenizer batches. This is safe
+        since the tokenizer returns new tensors and does not keep references to its inputs.
+        """
+        shape = (len(tensors), max(len(c) for c in tensors))
+        key = (name, shape)
+        if key not in self._batch_buffers:
+            self._batch_buffers[key] = torch.empty(shape, dtype=torch.float32)
+        return self._batch_buffers[key]
 
-    def _create_instance_splitter(self, mode: str):
+    def _create_instance_splitter(self, mode: Literal["training"]):
         instance_sampler = {
             "training": ExpectedNumInstanceSampler(
                 num_instances=1.0, min_future=self.prediction_length, min_instances=1
             ),
-            "validation": ValidationSplitSampler(min_future=self.prediction_length),
         }[mode]
 
         return InstanceSplitter(
@@ -127,14 +182,38 @@ class ChronosFineTuningDataset(IterableDataset):
         )
 
     def _create_training_data(self, data: Iterable[dict]):
-        data = chain.from_iterable(cycle([data]))
+        if len(self.gluonts_dataset) <= self.max_cached_items:
+            # Entries only hold views into the target array, so they are cheap to keep in memory. Caching them
+            # avoids rebuilding the entry dicts (and their pd.Period start timestamps) on every pass over the data
+            data = cycle(list(data))
+        else:
+            data = chain.from_iterable(cycle([data]))
         split_transform = self._create_instance_splitter("training")
         data = split_transform.apply(data, is_train=True)  # type: ignore
         return data
 
-    def _create_validation_data(self, data: Iterable[dict]):
-        data = self._create_instance_splitter("validation").apply(data, is_train=False)  # type: ignore
-        return data
+    def _create_validation_data(self) -> Iterator[dict]:
+        """Yields the last ``prediction_length`` values of each time series as ``future_target``, preceded by up to
+        ``context_length`` values left-padded with NaN as ``past_target``.
+
+        This is equivalent to applying an ``InstanceSplitter`` with a ``ValidationSplitSampler``, while slicing the
+        target array directly instead of passing each entry through the GluonTS transformation chain.
+        """
+        target_array = self.gluonts_dataset.target_array
+        indptr = self.gluonts_dataset.indptr
+        for j in range(len(indptr) - 1):
+            start, end = indptr[j], indptr[j + 1]
+            split_idx = end - self.prediction_length
+            if split_idx < start:
+                # time series is shorter than prediction_length
+                continue
+            past_target = np.full(self.context_length, fill_value=np.nan, dtype=np.float32)
+            past = target_array[max(start, split_idx - self.context_length) : split_idx]
+            past_target[self.context_length - len(past) :] = past
+            yield {
+                f"past_{FieldName.TARGET}": past_target,
+                f"future_{FieldName.TARGET}": target_array[split_idx:end],
+            }
 
     def to_chronos_format(self, entry: dict) -> dict:
         """Converts an entry from GluonTS data format with past and future targets
@@ -151,11 +230,11 @@ class ChronosFineTuningDataset(IterableDataset):
             time series data entry in HuggingFace format with ``input_ids``, ``attention_mask``, and ``labels``
         """
         assert self.tokenizer is not None, "A ChronosTokenizer is required to convert data into the Chronos format"
-        past_target = torch.tensor(entry[f"past_{FieldName.TARGET}"]).unsqueeze(0)
+        past_target = _as_tensor(entry[f"past_{FieldName.TARGET}"]).unsqueeze(0)
         input_ids, attention_mask, scale = self.tokenizer.context_input_transform(past_target)
-        future_target = torch.tensor(entry[f"future_{FieldName.TARGET}"]).unsqueeze(0)
+        future_target = _as_tensor(entry[f"future_{FieldName.TARGET}"]).unsqueeze(0)
         labels, labels_mask = self.tokenizer.label_input_transform(future_target, scale)
-        labels[labels_mask == 0] = -100
+        labels.masked_fill_(labels_mask == 0, -100)
 
         return {
             "input_ids": input_ids.squeeze(0),
@@ -163,6 +242,33 @@ class ChronosFineTuningDataset(IterableDataset):
             "labels": labels.squeeze(0),
         }
 
+    def to_chronos_format_batch(self, entries: list[dict]) -> list[dict]:
+        """Batched version of ``to_chronos_format``, which calls the ChronosTokenizer once for all entries.
+
+        Parameters
+        ----------
+        entries
+            time series data entries in GluonTS format with ``past_target`` and ``future_target`` keys
+
+        Returns
+        -------
+        list[dict]
+            time series data entries in HuggingFace format with ``input_ids``, ``attention_mask``, and ``labels``
+        """
+        assert self.tokenizer is not None, "A ChronosTokenizer is required to convert data into the Chronos format"
+        past_targets = [_as_tensor(entry[f"past_{FieldName.TARGET}"]) for entry in entries]
+        past_target = left_pad_and_stack_1D(past_targets, out=self._get_batch_buffer("past", past_targets))
+        input_ids, attention_mask, scale = self.tokenizer.context_input_transform(past_target)
+        future_targets = [_as_tensor(entry[f"future_{FieldName.TARGET}"]) for entry in entries]
+        future_target = left_pad_and_stack_1D(future_targets, out=self._get_batch_buffer("future", future_targets))
+        labels, labels_mask = self.tokenizer.label_input_transform(future_target, scale)
+        labels.masked_fill_(labels_mask == 0, -100)
+
+        return [
+            {"input_ids": ids, "attention_mask": mask, "labels": lbl}
+            for ids, mask, lbl in zip(input_ids.unbind(0), attention_mask.unbind(0), labels.unbind(0))
+        ]
+
     def to_chronos_bolt_format(self, entry: dict) -> dict:
         """Converts an entry from GluonTS data format with past and future targets
         to the format accepted by the ChronosBolt models.
@@ -177,22 +283,69 @@ class ChronosFineTuningDataset(IterableDataset):
         dict
             time series data entry in ChronosBolt format with ``context`` and ``target``
         """
-        past_target = torch.tensor(entry[f"past_{FieldName.TARGET}"])
-        future_target = torch.tensor(entry[f"future_{FieldName.TARGET}"])
+        past_target = _as_tensor(entry[f"past_{FieldName.TARGET}"])
+        future_target = _as_tensor(entry[f"future_{FieldName.TARGET}"])
 
         return {"context": past_target, "target": future_target}
 
+    def _iter_chronos_bolt_training_data(self) -> Iterator[dict]:
+        """Sample random ``context`` and ``target`` windows for ChronosBolt directly from the target array.
+
+        This mirrors the ``InstanceSplitter`` with an ``ExpectedNumInstanceSampler`` used in ``_create_training_data``
+        (on average one window per time series per pass, at least one window for each series that is long enough),
+        while skipping the construction and transformation of GluonTS entry dicts.
+        """
+        target_array = self.gluonts_dataset.target_array
+        indptr = self.gluonts_dataset.indptr
+        total_window_size, num_series_seen = 0, 0
+
+        while True:
+            num_yielded = 0
+            for j in range(len(indptr) - 1):
+                start, end = indptr[j], indptr[j + 1]
+                # split points leaving at least prediction_length future values
+                window_size = end - start - self.prediction_length + 1
+                if window_size <= 0:
+                    continue
+
+                num_series_seen += 1
+                total_window_size += window_size
+                p = min(1.0, num_series_seen / total_window_size)
+                num_instances = min(max(1, np.random.binomial(window_size, p)), window_size)
+                split_indices = start + np.sort(np.random.choice(window_size, size=num_instances, replace=False))
+
+                for split_idx in split_indices:
+                    context = np.full(self.context_length, fill_value=np.nan, dtype=np.float32)
+                    past = target_array[max(start, split_idx - self.context_length) : split_idx]
+                    context[self.context_length - len(past) :] = past
+                    future = target_array[split_idx : split_idx + self.prediction_length]
+                    yield {"context": torch.from_numpy(context), "target": _as_tensor(future)}
+                    num_yielded += 1
+
+            if num_yielded == 0:
+                # no time series is long enough to be sampled from
+                return
+
     def __iter__(self) -> Iterator:
+        if self.mode == "training" and self.tokenizer is None:
+            yield from self._iter_chronos_bolt_training_data()
+            return
+
         if self.mode == "training":
             iterable = self._create_training_data(self.gluonts_dataset)
         elif self.mode == "validation":
-            iterable = self._create_validation_data(self.gluonts_dataset)
+            iterable = self._create_validation_data()
         else:
             raise ValueError(f"Unknown mode {self.mode}")
 
-        format_transform_fn = self.to_chronos_format if self.tokenizer is not None else self.to_chronos_bolt_format
-        for entry in iterable:
-            yield format_transform_fn(entry)
+        if self.tokenizer is not None:
+            # tokenize entries in micro-batches to amortize the overhead of the tokenizer's tensor operations
+            iterator = iter(iterable)
+            while entries := list(islice(iterator, self.tokenizer_batch_size)):
+                yield from self.to_chronos_format_batch(entries)
+        else:
+            for entry in iterable:
+                yield self.to_chronos_bolt_format(entry)
 
     def shuffle(self, shuffle_buffer_size: int | None = None):
         """Returns a (pseudo) shuffled version of this iterable dataset.
@@ -208,32 +361,134 @@ class ChronosFineTuningDataset(IterableDataset):
         return PseudoShuffledIterableDataset(self, shuffle_buffer_size)
 
 
-def left_pad_and_stack_1D(tensors: list[torch.Tensor]) -> torch.Tensor:
-    max_len = max(len(c) for c in tensors)
-    padded = []
+def left_pad_and_stack_1D(tensors: list[torch.Tensor], out: torch.Tensor | None = None) -> torch.Tensor:
+    """Left-pad 1D tensors with NaN to the length of the longest one and stack them into a 2D tensor.
+
+    Parameters
+    ----------
+    tensors
+        The 1D tensors to pad and stack
+    out
+        If provided, a preallocated tensor of shape ``(len(tensors), max_len)`` that the result is written into,
+        which allows reusing the same buffer across batches.
+    """
     for c in tensors:
         assert isinstance(c, torch.Tensor)
         assert c.ndim == 1
-        padding = torch.full(size=(max_len - len(c),), fill_value=torch.nan, device=c.device)
-        padded.append(torch.concat((padding, c), dim=-1))
-    return torch.stack(padded)
+    max_len = max(len(c) for c in tensors)
+    if out is None:
+        # same dtype as concatenating the default-dtype NaN padding with each tensor
+        dtype = reduce(torch.promote_types, (c.dtype for c in tensors), torch.get_default_dtype())
+        out = torch.full(size=(len(tensors), max_len), fill_value=torch.nan, dtype=dtype, device=tensors[0].device)
+    else:
+        assert out.shape == (len(tensors), max_len), f"out must have shape {(len(tensors), max_len)}, got {out.shape}"
+        out.fill_(torch.nan)
+    for i, c in enumerate(tensors):
+        out[i, max_len - len(c) :].copy_(c)
+    return out
+
+
+# id(index) -> (weak reference to the index, indptr), entries are removed once the index is garbage collected
+_INDPTR_CACHE: dict[int, tuple[weakref.ref, np.ndarray]] = {}
+
+
+def _get_indptr(target_df: TimeSeriesDataFrame) -> np.ndarray:
+    """Returns ``target_df.get_indptr()``, reusing the result if datasets are repeatedly created from data with
+    the same (immutable) index, e.g., for inference and validation on the same data frame.
+    """
+    index = target_df.index
+    key = id(index)
+    cached = _INDPTR_CACHE.get(key)
+    if cached is not None and cached[0]() is index:
+        return cached[1]
+
+    indptr = target_df.get_indptr()
+    # the array is shared between datasets
+    indptr.flags.writeable = False
+    _INDPTR_CACHE[key] = (weakref.ref(index, lambda _: _INDPTR_CACHE.pop(key, None)), indptr)
+    return indptr
+
+
+def _gather_contexts(target: np.ndarray, indptr: np.ndarray, indices: np.ndarray, out: np.ndarray) -> None:
+    """Copy the last ``out.shape[1]`` values of each selected time series into the right end of the
+    corresponding row of the NaN-initialized ``out`` array.
+    """
+    context_length = out.shape[1]
+    for i in range(len(indices)):
+        end = indptr[indices[i] + 1]
+        start = max(indptr[indices[i]], end - context_length)
+        out[i, context_length - (end - start) :] = target[start:end]
+
+
+try:
+    import numba
+
+    # numba is available as a dependency of statsforecast; compiling the loop removes the per-item Python overhead
+    _gather_contexts = numba.njit(cache=True, nogil=True)(_gather_contexts)
+except ImportError:
+    pass
 
 
 class ChronosInferenceDataset:
-    """A container for time series datasets that implements the ``torch.utils.data.Dataset`` interface"""
+    """A container for time series datasets that implements the ``torch.utils.data.Dataset`` interface
+
+    Parameters
+    ----------
+    target_df
+        The ``TimeSeriesDataFrame`` to be converted
+    context_length
+        The length of the context returned for each time series
+    target_column
+        The name of the column which contains the target time series, by default "target"
+    eager_pad
+        If True, the left-padded contexts of all time series are computed once at construction time and stored
+        in a ``(num_items, context_length)`` array, so that items are returned as views into this array. This
+        trades ``num_items * context_length * 4`` bytes of memory for no work per item.
+
+    Notes
+    -----
+    When the dataset is pickled, e.g., to be sent to ``DataLoader`` worker processes started with the ``spawn``
+    or ``forkserver`` methods, its arrays are moved to shared memory and only the names of the shared memory
+    blocks are pickled, so that all workers map the same pages instead of each receiving a copy of the data.
+    The shared memory is released when the dataset that was pickled is garbage collected, so unpickled copies
+    must not outlive it.
+    """
+
+    _shareable_arrays = ("target_array", "indptr", "contexts")
 
     def __init__(
         self,
         target_df: TimeSeriesDataFrame,
         context_length: int,
         target_column: str = "target",
+        eager_pad: bool = False,
     ):
         assert context_length > 0
         self.context_length = context_length
-        self.target_array = target_df[target_column].to_numpy(dtype=np.float32)
+        # no copy is made if the target is already stored as float32, the array is only read from
+        self.target_array = target_df[target_column].to_numpy(dtype=np.float32, copy=False)
 
         # store pointer to start:end of each time series
-        self.indptr = target_df.get_indptr()
+        self.indptr = _get_indptr(target_df)
+
+        self.contexts: np.ndarray | None = self._get_padded_contexts() if eager_pad else None
+
+        self._shared_memory: dict[str, shared_memory.SharedMemory] = {}
+        self._owns_shared_memory = False
+
+    def _get_padded_contexts(self) -> np.ndarray:
+        """Gather the last ``context_length`` values of every time series into a NaN-padded matrix."""
+        num_items = len(self)
+        contexts = np.full((num_items, self.context_length), fill_value=np.nan, dtype=np.float32)
+
+        lengths = np.minimum(np.diff(self.indptr), self.context_length)
+        rows = np.repeat(np.arange(num_items), lengths)
+        # position of each copied value within the copied part of its time series
+        offsets = np.arange(len(rows)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        src = np.repeat(self.indptr[1:] - lengths, lengths) + offsets
+        cols = np.repeat(self.context_length - lengths, lengths) + offsets
+        contexts[rows, cols] = self.target_array[src]
+        return contexts
 
     def __len__(self):
         return len(self.indptr) - 1  # noqa
@@ -247,15 +502,93 @@ class ChronosInferenceDataset:
         return a
 
     def __getitem__(self, idx) -> np.ndarray:
+        if self.contexts is not None:
+            return self.contexts[idx]
+
         start_idx = self.indptr[idx]
         end_idx = self.indptr[idx + 1]
 
         return self._get_context(self.target_array[start_idx:end_idx])
 
+    def __getitems__(self, indices: list[int]) -> np.ndarray:
+        """Returns the left-padded contexts of a whole batch as a single contiguous array of shape
+        ``(len(indices), context_length)``, which ``torch.from_numpy`` can wrap without copying.
+        """
+        if self.contexts is not None:
+            return self.contexts[indices]
+
+        batch = np.full((len(indices), self.context_length), fill_value=np.nan, dtype=np.float32)
+        _gather_contexts(self.target_array, self.indptr, np.asarray(indices, dtype=np.int64), batch)
+        return batch
+
+    def _move_to_shared_memory(self) -> None:
+        for name in self._shareable_arrays:
+            array = getattr(self, name)
+            if array is None:
+                continue
+            # shared memory blocks of size 0 cannot be created
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            shared_array = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+            shared_array[...] = array
+            shared_array.flags.writeable = False
+            self._shared_memory[name] = shm
+            setattr(self, name, shared_array)
+        self._owns_shared_memory = True
+
+    def __getstate__(self):
+        if not self._shared_memory:
+            self._move_to_shared_memory()
+        state = self.__dict__.copy()
+        state["_shared_memory"] = {}
+        state["_owns_shared_memory"] = False
+        for name, shm in self._shared_memory.items():
+            array = state[name]
+            state[name] = (shm.name, array.shape, array.dtype.str)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for name in self._shareable_arrays:
+            if state[name] is None:
+                continue
+            shm_name, shape, dtype = state[name]
+            shm = shared_memory.SharedMemory(name=shm_name)
+            shared_array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+            shared_array.flags.writeable = False
+            self._shared_memory[name] = shm
+            setattr(self, name, shared_array)
+
+    def __del__(self):
+        if not getattr(self, "_shared_memory", None):
+            return
+        for name in self._shareable_arrays:
+            setattr(self, name, None)
+        for shm in self._shared_memory.values():
+            try:
+                shm.close()
+            except BufferError:
+                # views of the shared arrays are still referenced elsewhere, the block is unmapped once they are freed
+                pass
+            if self._owns_shared_memory:
+                shm.unlink()
+        self._shared_memory = {}
+
 
 class ChronosInferenceDataLoader(torch.utils.data.DataLoader):
+    """``DataLoader`` that calls the ``after_batch`` callback after each batch is consumed.
+
+    Unless set by the caller, batches are placed in pinned memory when CUDA is available, and
+    each worker process prefetches 4 batches when ``num_workers > 0``. Worker processes are not kept alive
+    across iterations since a new data loader is created for every call to predict.
+    Pinned batches should be moved to the GPU with ``batch.to(device, non_blocking=True)``.
+    """
+
     def __init__(self, *args, **kwargs):
         self.callback: Callable = kwargs.pop("after_batch", lambda: None)
+        if "pin_memory" not in kwargs:
+            kwargs["pin_memory"] = torch.cuda.is_available()
+        if kwargs.get("num_workers", 0) > 0:
+            kwargs.setdefault("prefetch_factor", 4)
         super().__init__(*args, **kwargs)
 
     def __iter__(self):  # type: ignore
@@ -264,6 +597,37 @@ class ChronosInferenceDataLoader(torch.utils.data.DataLoader):
             self.callback()
 
 
+def prefetch_to_device(batches: Iterable[torch.Tensor], device: torch.device) -> Iterator[torch.Tensor]:
+    """Move batches to ``device``, copying the next batch on a side CUDA stream while the
+    current batch is being consumed. On non-CUDA devices, batches are moved one at a time.
+    """
+    device = torch.device(device)
+    if device.type != "cuda":
+        for batch in batches:
+            yield batch.to(device)
+        return
+
+    stream = torch.cuda.Stream(device=device)
+    iterator = iter(batches)
+
+    def load_next() -> torch.Tensor | None:
+        try:
+            batch = next(iterator)
+        except StopIteration:
+            return None
+        with torch.cuda.stream(stream):
+            return batch.to(device, non_blocking=True)
+
+    next_batch = load_next()
+    while next_batch is not None:
+        torch.cuda.current_stream(device).wait_stream(stream)
+        batch = next_batch
+        # the batch was allocated on the side stream but is consumed on the current stream
+        batch.record_stream(torch.cuda.current_stream(device))
+        next_batch = load_next()
+        yield batch
+
+
 class EvaluateAndSaveFinalStepCallback(TrainerCallback):
     """Callback to evaluate and save the model at last training step."""
 
@@ -285,14 +649,15 @@ class TimeLimitCallback(TrainerCallback):
             maximum time allowed for training in seconds.
         """
         self.time_limit = time_limit
-        self.start_time = None
+        self.time_limit_ns = int(time_limit * 1e9)
+        self.start_time_ns = None
 
     def on_train_begin(self, args, state, control, **kwargs):
-        self.start_time = time.monotonic()  # type: ignore
+        self.start_time_ns = time.monotonic_ns()  # type: ignore
 
     def on_step_end(self, args, state, control, **kwargs):
-        elapsed_time = time.monotonic() - self.start_time  # type: ignore
-        if elapsed_time > self.time_limit:
+        elapsed_time_ns = time.monotonic_ns() - self.start_time_ns  # type: ignore
+        if elapsed_time_ns > self.time_limit_ns:
             logger.log(15, "Stopping fine-tuning since time_limit is reached")
             control.should_training_stop = True
 
@@ -305,13 +670,31 @@ class LoggerCallback(TrainerCallback):
             logger.info(logs)
 
 
-def timeout_callback(seconds: float | None) -> Callable:
-    """Return a callback object that raises an exception if time limit is exceeded."""
-    start_time = time.monotonic()
+def timeout_callback(seconds: float | None, check_every: int = 16) -> Callable:
+    """Return a callback object that raises an exception if time limit is exceeded.
+
+    The clock is read at most once every ``check_every`` calls. Based on the average time per call observed so far,
+    it is read earlier if the time limit would otherwise be exceeded before the next check.
+    """
+    if seconds is None:
+        return lambda: None
+
+    assert check_every > 0
+    start_time_ns = time.monotonic_ns()
+    time_limit_ns = int(seconds * 1e9)
+    num_calls = 0
+    next_check = 1
 
     def callback() -> None:
-        if seconds is not None and time.monotonic() - start_time > seconds:
+        nonlocal num_calls, next_check
+        num_calls += 1
+        if num_calls < next_check:
+            return
+        elapsed_ns = time.monotonic_ns() - start_time_ns
+        if elapsed_ns > time_limit_ns:
             raise TimeLimitExceeded
+        calls_until_time_limit = (time_limit_ns - elapsed_ns) * num_calls // max(elapsed_ns, 1)
+        next_check = num_calls + max(1, min(check_every, calls_until_time_limit))
 
     return callback
 
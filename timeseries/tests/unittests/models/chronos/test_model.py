@@ -1,3 +1,4 @@
+import contextlib
 from unittest import mock
 
 import numpy as np
@@ -8,6 +9,7 @@ from autogluon.common import space
 from autogluon.core.utils.exceptions import TimeLimitExceeded
 from autogluon.timeseries import TimeSeriesPredictor
 from autogluon.timeseries.models import ChronosModel
+from autogluon.timeseries.models.chronos.model import MODEL_CONFIGS
 
 from ...common import (
     DATAFRAME_WITH_COVARIATES,
@@ -204,6 +206,35 @@ def test_when_context_length_not_provided_then_context_length_set_to_dataset_len
     assert batch.shape[-1] == expected_context_length
 
 
+@pytest.mark.parametrize("max_eager_pad_bytes, expected_eager_pad", [(0, False), (1024**3, True)])
+def test_when_padded_contexts_fit_memory_budget_then_inference_dataset_padded_eagerly(
+    chronos_model_path, max_eager_pad_bytes, expected_eager_pad
+):
+    model = ChronosModel(hyperparameters={"model_path": chronos_model_path, "device": "cpu"})
+    model.fit(train_data=None)
+
+    with mock.patch.object(ChronosModel, "max_eager_pad_bytes", max_eager_pad_bytes):
+        data_loader = model._get_inference_data_loader(DUMMY_TS_DATAFRAME, context_length=16, batch_size=4)
+
+    assert (data_loader.dataset.contexts is not None) == expected_eager_pad
+
+
+def test_when_model_predicts_then_batches_are_prefetched_to_device_only_for_chronos_bolt(chronos_model_path):
+    from chronos import ChronosBoltPipeline
+
+    model = ChronosModel(hyperparameters={"model_path": chronos_model_path, "num_samples": 3, "device": "cpu"})
+    model.fit(train_data=None)
+    model.persist()
+
+    with mock.patch(
+        "autogluon.timeseries.models.chronos.utils.prefetch_to_device",
+        side_effect=lambda batches, device: iter(batches),
+    ) as patch_prefetch_to_device:
+        model.predict(DUMMY_TS_DATAFRAME)
+
+    assert patch_prefetch_to_device.called == isinstance(model.model_pipeline, ChronosBoltPipeline)
+
+
 @pytest.mark.parametrize(
     "init_context_length, data_length, expected_context_length",
     [
@@ -313,6 +344,25 @@ def test_when_model_persisted_then_model_pipeline_can_infer(chronos_model_path):
     assert model.model_pipeline.predict(torch.tensor([[1, 2, 3]])) is not None
 
 
+def test_when_model_warmed_up_then_dummy_batch_matches_inference_batch_and_autocast_context(chronos_model_path):
+    model = ChronosModel(
+        hyperparameters={"model_path": chronos_model_path, "batch_size": 4, "context_length": 32, "device": "cpu"}
+    )
+    model.fit(train_data=None)
+    model.persist()
+
+    with (
+        mock.patch.object(model.model_pipeline, "predict_quantiles") as patch_predict_quantiles,
+        mock.patch.object(
+            model, "_get_autocast_context", return_value=contextlib.nullcontext()
+        ) as patch_get_autocast_context,
+    ):
+        model._warm_up_model_pipeline()
+
+    assert patch_predict_quantiles.call_args.args[0].shape == (4, 32)
+    patch_get_autocast_context.assert_called_once()
+
+
 def test_when_model_not_persisted_only_fit_then_model_pipeline_is_none(chronos_model_path):
     model = ChronosModel(
         hyperparameters={
@@ -494,6 +544,25 @@ def test_when_chronos_bolt_fine_tuned_with_custom_quantiles_then_loaded_model_ha
     assert predictions.columns.tolist() == ["mean"] + [str(q) for q in custom_quantiles]
 
 
+def test_when_fine_tuned_model_saved_and_loaded_then_default_config_resolved_from_fine_tuned_checkpoint(
+    temp_model_path,
+):
+    model = ChronosModel(
+        path=temp_model_path,
+        hyperparameters={"model_path": CHRONOS_CLASSIC_MODEL_PATH, "fine_tune": True, "fine_tune_steps": 1},
+    )
+    model.fit(DUMMY_TS_DATAFRAME)
+    model.save()
+
+    # the entry of the pretrained model requires a GPU, but must not apply to the fine-tuned checkpoint
+    with mock.patch.dict(MODEL_CONFIGS, {CHRONOS_CLASSIC_MODEL_PATH: {"num_gpus": 1}}, clear=True):
+        loaded_model = ChronosModel.load(model.path)
+        assert loaded_model.model_path.endswith(ChronosModel.fine_tuned_ckpt_name)
+        assert loaded_model.min_num_gpus == 0
+        predictions = loaded_model.predict(DUMMY_TS_DATAFRAME)
+    assert not predictions.isna().any().any()
+
+
 def test_when_chronos_bolt_no_fine_tune_with_custom_quantiles_then_original_quantiles_preserved():
     original_quantiles = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
     model = ChronosModel(
@@ -504,6 +573,28 @@ def test_when_chronos_bolt_no_fine_tune_with_custom_quantiles_then_original_quan
     assert model.model_pipeline.quantiles == original_quantiles
 
 
+@pytest.mark.parametrize("device_capability, expected_autocast", [((7, 5), False), ((8, 0), True)])
+def test_when_float32_model_on_gpu_then_bfloat16_autocast_used_only_with_native_support(
+    device_capability, expected_autocast
+):
+    model = ChronosModel(hyperparameters={"model_path": CHRONOS_BOLT_MODEL_PATH, "torch_dtype": "auto"})
+    model._model_pipeline = mock.MagicMock()
+    model._model_pipeline.inner_model.dtype = torch.float32
+    model._model_pipeline.inner_model.device = torch.device("cuda")
+
+    with (
+        mock.patch("torch.cuda.get_device_capability", return_value=device_capability),
+        mock.patch("torch.autocast") as patch_autocast,
+    ):
+        autocast_context = model._get_autocast_context()
+
+    if expected_autocast:
+        patch_autocast.assert_called_once_with(device_type="cuda", dtype=torch.bfloat16)
+    else:
+        patch_autocast.assert_not_called()
+        assert isinstance(autocast_context, contextlib.nullcontext)
+
+
 def test_when_revision_provided_then_from_pretrained_is_called_with_revision(chronos_model_path):
     model_revision = "my-test-branch"
     model = ChronosModel(
@@ -1,5 +1,8 @@
+import pickle
+
 import numpy as np
 import pytest
+import torch
 from chronos import ChronosConfig
 from flaky import flaky
 
@@ -9,6 +12,8 @@ from autogluon.timeseries.models.chronos.utils import (
     ChronosInferenceDataLoader,
     ChronosInferenceDataset,
     PseudoShuffledIterableDataset,
+    left_pad_and_stack_1D,
+    prefetch_to_device,
     timeout_callback,
 )
 
@@ -84,6 +89,44 @@ def test_chronos_fine_tuning_dataset_returns_data_in_chronos_format_when_tokeniz
     assert entry["labels"].shape[-1] == prediction_length + 1
 
 
+@pytest.mark.parametrize("context_length", [5, 20])
+def test_when_entries_tokenized_in_batch_then_output_matches_tokenizing_each_entry(context_length):
+    prediction_length = 4
+    tokenizer = ChronosConfig(
+        tokenizer_class="MeanScaleUniformBins",
+        tokenizer_kwargs={"low_limit": -15, "high_limit": 15},
+        n_tokens=4096,
+        n_special_tokens=2,
+        pad_token_id=0,
+        eos_token_id=1,
+        use_eos_token=True,
+        model_type="seq2seq",
+        context_length=context_length,
+        prediction_length=prediction_length,
+        num_samples=20,
+        temperature=1.0,
+        top_k=50,
+        top_p=1.0,
+    ).create_tokenizer()
+    fine_tuning_dataset = ChronosFineTuningDataset(
+        DUMMY_TS_DATAFRAME,
+        context_length=context_length,
+        prediction_length=prediction_length,
+        tokenizer=tokenizer,
+        mode="validation",
+    )
+    entries = list(fine_tuning_dataset._create_validation_data())
+
+    batched = fine_tuning_dataset.to_chronos_format_batch(entries)
+    # the buffers used to stack the targets are reused, which must not affect the outputs of previous batches
+    fine_tuning_dataset.to_chronos_format_batch(entries[::-1])
+    assert len(batched) == len(entries)
+    for batched_entry, entry in zip(batched, entries):
+        expected = fine_tuning_dataset.to_chronos_format(entry)
+        for key in ["input_ids", "attention_mask", "labels"]:
+            assert torch.equal(batched_entry[key], expected[key])
+
+
 @pytest.mark.parametrize("data", DATASETS)
 @pytest.mark.parametrize("context_length", [5, 10, 20])
 @pytest.mark.parametrize("prediction_length", [4, 8, 10])
@@ -105,6 +148,37 @@ def test_chronos_fine_tuning_dataset_returns_data_in_chronos_bolt_format_when_to
     assert entry["target"].shape[-1] == prediction_length
 
 
+@pytest.mark.parametrize("context_length", [5, 20])
+@pytest.mark.parametrize("prediction_length", [4, 10])
+def test_when_validation_data_created_then_windows_match_validation_instance_splitter(
+    context_length, prediction_length
+):
+    from gluonts.dataset.field_names import FieldName
+    from gluonts.transform import InstanceSplitter, ValidationSplitSampler
+
+    data = get_data_frame_with_variable_lengths({"A": 3, "B": 15, "C": 40})
+    fine_tuning_dataset = ChronosFineTuningDataset(
+        data, context_length=context_length, prediction_length=prediction_length, mode="validation"
+    )
+    splitter = InstanceSplitter(
+        target_field=FieldName.TARGET,
+        is_pad_field=FieldName.IS_PAD,
+        start_field=FieldName.START,
+        forecast_start_field=FieldName.FORECAST_START,
+        instance_sampler=ValidationSplitSampler(min_future=prediction_length),
+        past_length=context_length,
+        future_length=prediction_length,
+        dummy_value=np.nan,
+    )
+    expected = list(splitter.apply(fine_tuning_dataset.gluonts_dataset, is_train=False))
+    result = list(fine_tuning_dataset._create_validation_data())
+
+    assert len(result) == len(expected)
+    for entry, expected_entry in zip(result, expected):
+        for key in ["past_target", "future_target"]:
+            np.testing.assert_array_equal(entry[key], expected_entry[key])
+
+
 @pytest.mark.parametrize(
     "shuffle_buffer_size, expected_type",
     [(100, PseudoShuffledIterableDataset), (0, ChronosFineTuningDataset), (None, ChronosFineTuningDataset)],
@@ -154,6 +228,49 @@ def test_when_inference_dataset_initialized_then_indptr_set_correctly(item_id_to
     assert inference_dataset.indptr.tolist() == expected_indptr
 
 
+@pytest.mark.parametrize("context_length", [5, 10, 20])
+def test_when_inference_dataset_batch_fetched_then_contexts_match_individual_items(context_length):
+    data = get_data_frame_with_variable_lengths({"A": 20, "B": 12, "C": 1})
+    inference_dataset = ChronosInferenceDataset(data, context_length=context_length)
+    batch = inference_dataset.__getitems__([2, 0, 1])
+
+    assert batch.shape == (3, context_length)
+    assert batch.flags.c_contiguous
+    for row, idx in zip(batch, [2, 0, 1]):
+        np.testing.assert_array_equal(row, inference_dataset[idx])
+
+
+@pytest.mark.parametrize("context_length", [5, 10, 20])
+def test_when_inference_dataset_eagerly_padded_then_items_match_lazy_dataset(context_length):
+    data = get_data_frame_with_variable_lengths({"A": 20, "B": 12, "C": 1})
+    lazy_dataset = ChronosInferenceDataset(data, context_length=context_length)
+    eager_dataset = ChronosInferenceDataset(data, context_length=context_length, eager_pad=True)
+
+    for idx in range(len(lazy_dataset)):
+        np.testing.assert_array_equal(eager_dataset[idx], lazy_dataset[idx])
+    np.testing.assert_array_equal(eager_dataset.__getitems__([2, 0]), lazy_dataset.__getitems__([2, 0]))
+
+
+@pytest.mark.parametrize("eager_pad", [True, False])
+def test_when_inference_dataset_pickled_then_unpickled_copy_reads_from_shared_memory(eager_pad):
+    data = get_data_frame_with_variable_lengths({"A": 20, "B": 12, "C": 1})
+    inference_dataset = ChronosInferenceDataset(data, context_length=10, eager_pad=eager_pad)
+    expected = inference_dataset.__getitems__([0, 1, 2])
+
+    unpickled_dataset = pickle.loads(pickle.dumps(inference_dataset))
+
+    assert set(unpickled_dataset._shared_memory) == set(inference_dataset._shared_memory)
+    assert not unpickled_dataset._owns_shared_memory
+    for name, shm in unpickled_dataset._shared_memory.items():
+        assert shm.name == inference_dataset._shared_memory[name].name
+    np.testing.assert_array_equal(unpickled_dataset.__getitems__([0, 1, 2]), expected)
+    np.testing.assert_array_equal(inference_dataset.__getitems__([0, 1, 2]), expected)
+
+    unpickled_dataset.__del__()
+    inference_dataset.__del__()
+    assert not inference_dataset._shared_memory
+
+
 # ChronosInferenceDataLoader tests
 
 
@@ -171,3 +288,32 @@ def test_when_chronos_inference_dataloader_used_and_time_limit_exceeded_then_exc
     with pytest.raises(TimeLimitExceeded):
         for _ in data_loader:
             pass
+
+
+def test_when_batches_prefetched_to_cpu_then_all_batches_returned_in_order():
+    batches = [torch.arange(i, i + 3, dtype=torch.float32) for i in range(5)]
+    prefetched = list(prefetch_to_device(batches, "cpu"))
+
+    assert len(prefetched) == len(batches)
+    for original, result in zip(batches, prefetched):
+        assert torch.equal(original, result)
+
+
+def test_when_tensors_left_padded_and_stacked_then_values_are_right_aligned():
+    tensors = [torch.arange(3, dtype=torch.float32), torch.arange(1, dtype=torch.float32), torch.arange(5)]
+    result = left_pad_and_stack_1D(tensors)
+
+    assert result.shape == (3, 5)
+    assert result.dtype == torch.float32
+    for row, c in zip(result, tensors):
+        assert torch.isnan(row[: 5 - len(c)]).all()
+        assert torch.equal(row[5 - len(c) :], c.to(torch.float32))
+
+
+def test_when_out_tensor_provided_to_left_pad_and_stack_then_result_is_written_into_it():
+    tensors = [torch.arange(3, dtype=torch.float32), torch.arange(1, dtype=torch.float32)]
+    out = torch.zeros((2, 3))
+    result = left_pad_and_stack_1D(tensors, out=out)
+
+    assert result is out
+    assert torch.equal(torch.nan_to_num(result, nan=-1.0), torch.tensor([[0.0, 1.0, 2.0], [-1.0, -1.0, 0.0]]))